@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import heapq
+
 from src.generation.common import _runtime_error
 from src.schema_project_model import SchemaProject
 
@@ -25,19 +27,17 @@ def _dependency_order(project: SchemaProject) -> list[str]:
     # for fk in project.foreign_keys:
     #     fks_by_child.setdefault(fk.child_table, []).append(fk)
 
-    # Kahn
-    ready = [t for t in table_names if len(deps[t]) == 0]
-    ready.sort()
+    # Kahn; ``ready`` is a min-heap so the smallest ready table name is always next.
+    ready = sorted(t for t in table_names if len(deps[t]) == 0)
     out = []
 
     while ready:
-        n = ready.pop(0)
+        n = heapq.heappop(ready)
         out.append(n)
-        for child in sorted(rev[n]):
+        for child in rev[n]:
             deps[child].discard(n)
             if len(deps[child]) == 0:
-                ready.append(child)
-                ready.sort()
+                heapq.heappush(ready, child)
 
     if len(out) != len(table_names):
         raise ValueError(
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 
 def _add_column(self) -> None:
     if self.selected_table_index is None:
@@ -32,7 +34,7 @@ def _add_column(self) -> None:
                         "change dtype to 'int' or disable Primary key",
                     )
                 )
-            cols = [ColumnSpec(**{**c.__dict__, "primary_key": False}) for c in cols]  # type: ignore
+            cols = [replace(c, primary_key=False) for c in cols]
 
         cols.append(new_col)
 
@@ -119,7 +121,7 @@ def _apply_selected_column_changes(self) -> None:
                     )
                 )
             cols = [
-                ColumnSpec(**{**c.__dict__, "primary_key": False}) if i != col_idx else c
+                replace(c, primary_key=False) if i != col_idx else c
                 for i, c in enumerate(cols)
             ]
 
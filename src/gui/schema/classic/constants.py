@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import base64
+from binascii import b2a_base64
 
 DTYPES = ["int", "decimal", "text", "bool", "date", "datetime", "bytes"]
 GENERATORS = [
@@ -168,7 +168,7 @@ def _gui_error(location: str, issue: str, hint: str) -> str:
 
 def _csv_export_value(value: object) -> object:
     if isinstance(value, bytes):
-        return base64.b64encode(value).decode("ascii")
+        return b2a_base64(value, newline=False).decode("ascii")
     return value
 
 __all__ = [
@@ -1,7 +1,6 @@
 ﻿from __future__ import annotations
 
 import json
-import os
 import time
 from pathlib import Path
 import tkinter as tk
@@ -26,6 +25,7 @@ from src.gui_kit.ui_dispatch import UIDispatcher
 from src.gui_tools.run_workflow_view import RunWorkflowCapabilities
 from src.gui_tools.run_workflow_view import RunWorkflowSurface
 from src.multiprocessing_runtime import EXECUTION_MODES
+from src.multiprocessing_runtime import available_cpu_count
 from src.multiprocessing_runtime import MultiprocessEvent
 from src.multiprocessing_runtime import MultiprocessRunCancelled
 from src.multiprocessing_runtime import MultiprocessRunResult
@@ -46,7 +46,7 @@ class ExecutionOrchestratorBase(ttk.Frame):
         self.project = None
         self._loaded_schema_path = ""
 
-        cpu_count = max(1, int(os.cpu_count() or 1))
+        cpu_count = available_cpu_count()
         default_workers = max(1, min(4, cpu_count))
         self.model = RunWorkflowViewModel(
             execution_mode=EXECUTION_MODES[1],
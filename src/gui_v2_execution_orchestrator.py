@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 import tkinter as tk
 from tkinter import ttk
 
@@ -19,6 +18,7 @@ from src.gui_tools.run_workflow_view import RunWorkflowCapabilities
 from src.gui_tools.run_workflow_view import RunWorkflowSurface
 from src.gui_v2_redesign import V2ShellFrame
 from src.multiprocessing_runtime import EXECUTION_MODES
+from src.multiprocessing_runtime import available_cpu_count
 
 
 class ExecutionOrchestratorV2Screen(ExecutionOrchestratorBase):
@@ -31,7 +31,7 @@ class ExecutionOrchestratorV2Screen(ExecutionOrchestratorBase):
         self.project = None
         self._loaded_schema_path = ""
 
-        cpu_count = max(1, int(os.cpu_count() or 1))
+        cpu_count = available_cpu_count()
         default_workers = max(1, min(4, cpu_count))
         self.model = RunWorkflowViewModel(
             execution_mode=EXECUTION_MODES[1],
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from src.runtime.core.mp_types import (
     EXECUTION_MODES,
+    LEDGER_PERSIST_POLICIES,
     MultiprocessConfig,
     MultiprocessEvent,
     MultiprocessRunCancelled,
@@ -14,13 +15,17 @@ from src.runtime.core.mp_types import (
 from src.runtime.core.mp_config import (
     _orchestrator_error,
     _parse_bounded_int,
+    _parse_ledger_persist_policy,
     _parse_mode,
+    available_cpu_count,
     build_multiprocess_config,
     multiprocess_config_from_payload,
     multiprocess_config_to_payload,
     validate_multiprocess_config,
 )
 from src.runtime.core.mp_partition import (
+    ROUND_ROBIN_ASSIGNMENT_ENV_VAR,
+    _build_partition_plan,
     _selected_tables_with_required_parents,
     _topological_selected_table_order,
     build_partition_plan,
@@ -34,6 +39,7 @@ from src.runtime.core.mp_ledger import (
     save_run_ledger,
     validate_run_ledger,
 )
+from src.runtime.core.mp_events import _EventBuffer
 from src.runtime.core.mp_execution import (
     _emit_event,
     _ensure_not_cancelled,
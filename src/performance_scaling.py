@@ -24,6 +24,7 @@ from src.runtime.core.perf_profile import (
     build_performance_profile,
 )
 from src.runtime.core.perf_planning import (
+    _build_chunk_plan_core,
     _selected_table_names,
     _selected_tables_with_required_parents,
     _topological_table_order,
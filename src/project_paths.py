@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
@@ -23,6 +25,10 @@ def resolve_repo_path(path_value: str, *, root: Path | None = None) -> Path:
 
 
 def to_repo_relative_path(path_value: str, *, root: Path | None = None) -> str:
+    raw = Path(path_value.strip())
+    if not raw.is_absolute():
+        # Already repo-relative: joining the root and stripping it again would be a no-op.
+        return raw.as_posix()
     root_path = root or repo_root()
     resolved = resolve_repo_path(path_value, root=root_path)
     try:
@@ -32,10 +38,9 @@ def to_repo_relative_path(path_value: str, *, root: Path | None = None) -> str:
 
 
 def _rebuild_from_anchor(raw_path: Path, root_path: Path, *, anchor: str) -> Path | None:
-    lowered_parts = [part.lower() for part in raw_path.parts]
     anchor_lower = anchor.lower()
-    if anchor_lower not in lowered_parts:
-        return None
-
-    idx = lowered_parts.index(anchor_lower)
-    return root_path.joinpath(*raw_path.parts[idx:])
+    parts = raw_path.parts
+    for idx, part in enumerate(parts):
+        if part.lower() == anchor_lower:
+            return root_path.joinpath(*parts[idx:])
+    return None
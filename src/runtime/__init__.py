@@ -26,6 +26,7 @@ _PERF_EXPORTS = {
 
 _MP_EXPORTS = {
     "EXECUTION_MODES",
+    "LEDGER_PERSIST_POLICIES",
     "MultiprocessConfig",
     "PartitionPlanEntry",
     "WorkerStatus",
@@ -33,6 +34,7 @@ _MP_EXPORTS = {
     "MultiprocessEvent",
     "MultiprocessRunResult",
     "MultiprocessRunCancelled",
+    "available_cpu_count",
     "build_multiprocess_config",
     "validate_multiprocess_config",
     "multiprocess_config_to_payload",
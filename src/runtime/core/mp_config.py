@@ -3,11 +3,17 @@ from __future__ import annotations
 import os
 from typing import Any
 
-from src.runtime.core.mp_types import EXECUTION_MODES, MultiprocessConfig
+from src.runtime.core.mp_types import EXECUTION_MODES, LEDGER_PERSIST_POLICIES, MultiprocessConfig
 
 def _orchestrator_error(field: str, issue: str, hint: str) -> str:
     return f"Execution Orchestrator / {field}: {issue}. Fix: {hint}."
 
+def available_cpu_count() -> int:
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return max(1, int(os.cpu_count() or 1))
+
 def _parse_mode(value: Any) -> str:
     text = str(value).strip().lower()
     if text not in EXECUTION_MODES:
@@ -21,6 +27,19 @@ def _parse_mode(value: Any) -> str:
         )
     return text
 
+def _parse_ledger_persist_policy(value: Any) -> str:
+    text = str(value).strip().lower()
+    if text not in LEDGER_PERSIST_POLICIES:
+        allowed = ", ".join(LEDGER_PERSIST_POLICIES)
+        raise ValueError(
+            _orchestrator_error(
+                "Ledger persist policy",
+                f"unsupported policy '{value}'",
+                f"choose one of: {allowed}",
+            )
+        )
+    return text
+
 def _parse_bounded_int(value: Any, *, field: str, minimum: int, maximum: int, hint: str) -> int:
     try:
         parsed = int(value)
@@ -39,6 +58,7 @@ def build_multiprocess_config(
     max_inflight_chunks_value: Any,
     ipc_queue_size_value: Any,
     retry_limit_value: Any,
+    ledger_persist_policy_value: Any = LEDGER_PERSIST_POLICIES[0],
 ) -> MultiprocessConfig:
     mode = _parse_mode(mode_value)
     worker_count = _parse_bounded_int(
@@ -69,18 +89,20 @@ def build_multiprocess_config(
         maximum=50,
         hint="set retry_limit to 0 or a positive whole number",
     )
+    ledger_persist_policy = _parse_ledger_persist_policy(ledger_persist_policy_value)
     config = MultiprocessConfig(
         mode=mode,
         worker_count=worker_count,
         max_inflight_chunks=max_inflight_chunks,
         ipc_queue_size=ipc_queue_size,
         retry_limit=retry_limit,
+        ledger_persist_policy=ledger_persist_policy,
     )
     validate_multiprocess_config(config)
     return config
 
 def validate_multiprocess_config(config: MultiprocessConfig) -> None:
-    cpu_count = max(1, int(os.cpu_count() or 1))
+    cpu_count = available_cpu_count()
 
     if config.mode == "single_process" and config.worker_count != 1:
         raise ValueError(
@@ -130,6 +152,8 @@ def multiprocess_config_to_payload(config: MultiprocessConfig) -> dict[str, obje
         "max_inflight_chunks": config.max_inflight_chunks,
         "ipc_queue_size": config.ipc_queue_size,
         "retry_limit": config.retry_limit,
+        "ledger_persist_policy": config.ledger_persist_policy,
+        "available_cpus": available_cpu_count(),
     }
 
 def multiprocess_config_from_payload(payload: dict[str, object]) -> MultiprocessConfig:
@@ -139,4 +163,5 @@ def multiprocess_config_from_payload(payload: dict[str, object]) -> Multiprocess
         max_inflight_chunks_value=payload.get("max_inflight_chunks", 4),
         ipc_queue_size_value=payload.get("ipc_queue_size", 128),
         retry_limit_value=payload.get("retry_limit", 1),
+        ledger_persist_policy_value=payload.get("ledger_persist_policy", LEDGER_PERSIST_POLICIES[0]),
     )
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+from src.runtime.core.mp_types import MultiprocessEvent
+
+
+_DROPPABLE_EVENT_KINDS = frozenset({"progress"})
+
+
+class _EventBuffer:
+    """Buffer scheduler events and deliver them to ``on_event`` from a dispatch thread.
+
+    When the buffer is full, ``progress`` events are dropped (later progress events carry
+    cumulative totals) and any other event kind flushes the buffer inline.
+    """
+
+    def __init__(
+        self,
+        on_event: Callable[[MultiprocessEvent], None] | None,
+        *,
+        capacity: int,
+    ) -> None:
+        self._on_event = on_event
+        self._capacity = max(1, int(capacity))
+        self._events: deque[MultiprocessEvent] = deque()
+        self._wake = threading.Event()
+        self._closing = False
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+        self.dropped_events = 0
+
+    def emit(self, event: MultiprocessEvent) -> None:
+        if self._on_event is None:
+            return
+        self._raise_pending_error()
+        if len(self._events) >= self._capacity:
+            if event.kind in _DROPPABLE_EVENT_KINDS:
+                self.dropped_events += 1
+                return
+            self._events.append(event)
+            self.flush()
+            return
+        self._events.append(event)
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._dispatch_loop,
+                name="mp-event-dispatch",
+                daemon=True,
+            )
+            self._thread.start()
+        self._wake.set()
+
+    def emit_sync(self, event: MultiprocessEvent) -> None:
+        if self._on_event is None:
+            return
+        self.flush()
+        self._on_event(event)
+
+    def flush(self) -> None:
+        self._stop_dispatch_thread()
+        self._raise_pending_error()
+        on_event = self._on_event
+        if on_event is None:
+            return
+        while self._events:
+            on_event(self._events.popleft())
+
+    def close(self) -> None:
+        self._stop_dispatch_thread()
+        if self._error is not None or self._on_event is None:
+            self._events.clear()
+            return
+        on_event = self._on_event
+        while self._events:
+            on_event(self._events.popleft())
+
+    def _stop_dispatch_thread(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._closing = True
+        self._wake.set()
+        thread.join()
+        self._thread = None
+        self._closing = False
+        self._wake.clear()
+
+    def _raise_pending_error(self) -> None:
+        if self._error is None:
+            return
+        error = self._error
+        self._error = None
+        self._events.clear()
+        raise error
+
+    def _dispatch_loop(self) -> None:
+        on_event = self._on_event
+        if on_event is None:
+            return
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while self._events and self._error is None:
+                try:
+                    on_event(self._events.popleft())
+                except BaseException as exc:  # surfaced to the scheduler on next emit/flush
+                    self._error = exc
+            if self._closing or self._error is not None:
+                return
+
+
+class _ProgressThrottle:
+    """Rate-limit progress events to every ``max(total_rows // 100, 1000)`` rows or ``min_interval_seconds``."""
+
+    def __init__(self, total_rows: int, *, min_interval_seconds: float = 0.1) -> None:
+        self._total_rows = total_rows
+        self._row_step = max(total_rows // 100, 1000)
+        self._min_interval_seconds = min_interval_seconds
+        self._last_rows = 0
+        self._last_time = float("-inf")
+
+    def should_emit(self, processed_rows: int) -> bool:
+        now = time.perf_counter()
+        if (
+            processed_rows >= self._total_rows
+            or processed_rows - self._last_rows >= self._row_step
+            or now - self._last_time >= self._min_interval_seconds
+        ):
+            self._last_rows = processed_rows
+            self._last_time = now
+            return True
+        return False
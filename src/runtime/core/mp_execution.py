@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import concurrent.futures
+import contextlib
+import multiprocessing
 import random
 import time
+from collections import deque
+from itertools import repeat, starmap
 from typing import Callable
 
 from src.performance_scaling import (
@@ -14,13 +18,18 @@ from src.performance_scaling import (
 )
 from src.schema_project_model import SchemaProject
 from src.runtime.core.mp_config import _orchestrator_error, validate_multiprocess_config
+from src.runtime.core.mp_events import _EventBuffer, _ProgressThrottle
 from src.runtime.core.mp_ledger import (
+    _LedgerCommitCoordinator,
+    _ledger_commit_coordinator,
+    _ledger_partition_views,
+    _prepare_ledger_path,
     apply_run_ledger_to_plan,
     create_run_ledger,
     save_run_ledger,
     validate_run_ledger,
 )
-from src.runtime.core.mp_partition import build_partition_plan, build_worker_status_snapshot, derive_partition_seed
+from src.runtime.core.mp_partition import _build_partition_plan, build_worker_status_snapshot, derive_partition_seed
 from src.runtime.core.mp_types import (
     MultiprocessConfig,
     MultiprocessEvent,
@@ -49,19 +58,53 @@ def _ensure_not_cancelled(cancel_requested: Callable[[], bool] | None, phase: st
             )
         )
 
-def _run_partition_task(task: _PartitionTask) -> dict[str, object]:
+_CHECKSUM_MODULUS = 2_147_483_647
+_CHECKSUM_VALUE_SCALE = 1_000_000.0
+
+_WORKER_RNG: random.Random | None = None
+
+def _worker_init() -> None:
+    global _WORKER_RNG
+    import src.performance_scaling  # noqa: F401
+
+    _WORKER_RNG = random.Random()
+
+def _worker_pool_context() -> multiprocessing.context.BaseContext | None:
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    return context
+
+def _partition_checksum(start_row: int, row_count: int, partition_seed: int) -> int:
+    """Sum of per-row ``int(random * 1e6) + offset + start_row`` reduced modulo 2^31 - 1."""
+    rng = _WORKER_RNG
+    if rng is None:
+        rng = random.Random(partition_seed)
+    else:
+        rng.seed(partition_seed)
+    next_random = rng.random
+    value_total = sum(
+        map(int, map(_CHECKSUM_VALUE_SCALE.__mul__, starmap(next_random, repeat((), row_count))))
+    )
+    offset_total = (row_count * (row_count - 1)) // 2
+    return (value_total + offset_total + (row_count * start_row)) % _CHECKSUM_MODULUS
+
+# (rows_processed, checksum, memory_mb): the scheduler already knows partition identity,
+# so batch results cross the process boundary as plain scalar tuples.
+_PartitionOutcome = tuple[int, int, float]
+
+def _run_partition_outcome(task: _PartitionTask) -> _PartitionOutcome:
     if task.force_fail:
         raise RuntimeError(f"injected worker failure for partition '{task.partition_id}'")
 
     row_count = max(0, (task.end_row - task.start_row) + 1)
-    rng = random.Random(task.partition_seed)
-
-    checksum = 0
-    for offset in range(row_count):
-        value = int(rng.random() * 1_000_000)
-        checksum = (checksum + value + offset + task.start_row) % 2_147_483_647
-
+    checksum = _partition_checksum(task.start_row, row_count, task.partition_seed)
     memory_mb = round((row_count * 24.0) / (1024.0 * 1024.0), 6)
+    return (row_count, checksum, memory_mb)
+
+def _run_partition_task(task: _PartitionTask) -> dict[str, object]:
+    row_count, checksum, memory_mb = _run_partition_outcome(task)
     return {
         "partition_id": task.partition_id,
         "table_name": task.table_name,
@@ -70,14 +113,56 @@ def _run_partition_task(task: _PartitionTask) -> dict[str, object]:
         "memory_mb": memory_mb,
     }
 
+def _run_partition_batch(tasks: tuple[_PartitionTask, ...]) -> list[_PartitionOutcome | Exception]:
+    outcomes: list[_PartitionOutcome | Exception] = []
+    for task in tasks:
+        try:
+            outcomes.append(_run_partition_outcome(task))
+        except Exception as exc:
+            outcomes.append(exc)
+    return outcomes
+
+_TASK_COMPLETION_EWMA_ALPHA = 0.2
+_TARGET_SUBMISSION_LATENCY_S = 0.05
+
+def _update_completion_ewma(current: float | None, sample_seconds: float) -> float:
+    if current is None:
+        return sample_seconds
+    return (_TASK_COMPLETION_EWMA_ALPHA * sample_seconds) + ((1.0 - _TASK_COMPLETION_EWMA_ALPHA) * current)
+
+def _adaptive_inflight_cap(config: MultiprocessConfig, completion_ewma: float | None) -> int:
+    if completion_ewma is None or completion_ewma <= 0.0:
+        return config.max_inflight_chunks
+    latency_window = int(_TARGET_SUBMISSION_LATENCY_S / completion_ewma)
+    return min(config.max_inflight_chunks, max(config.worker_count * 2, latency_window))
+
+def _claim_worker_slot(preferred_worker: int, worker_inflight: dict[int, int]) -> int:
+    if worker_inflight.get(preferred_worker, 0) == 0:
+        return preferred_worker
+    return min(worker_inflight, key=lambda worker_id: (worker_inflight[worker_id], worker_id))
+
+def _partition_batch_size(pending_count: int, worker_count: int) -> int:
+    return max(1, pending_count // (max(1, worker_count) * 4))
+
 def _group_by_stage(partition_plan: list[PartitionPlanEntry]) -> dict[int, list[PartitionPlanEntry]]:
+    """Group partitions by stage, keeping plan order (tables in dependency order, chunks ascending)."""
     by_stage: dict[int, list[PartitionPlanEntry]] = {}
     for entry in partition_plan:
         by_stage.setdefault(entry.stage, []).append(entry)
-    for stage_entries in by_stage.values():
-        stage_entries.sort(key=lambda item: (item.table_name, item.chunk_index))
     return by_stage
 
+def _summarize_partition_plan(
+    partition_plan: list[PartitionPlanEntry],
+) -> tuple[int, int, dict[int, list[PartitionPlanEntry]]]:
+    total_rows = 0
+    processed_rows = 0
+    for entry in partition_plan:
+        rows = entry.rows_in_partition
+        total_rows += rows
+        if entry.status == "done":
+            processed_rows += rows
+    return total_rows, processed_rows, _group_by_stage(partition_plan)
+
 def _update_ledger_partition(ledger: dict[str, object], entry: PartitionPlanEntry) -> None:
     partitions = ledger.setdefault("partitions", {})
     if not isinstance(partitions, dict):
@@ -92,6 +177,15 @@ def _update_ledger_partition(ledger: dict[str, object], entry: PartitionPlanEntr
     part["retry_count"] = entry.retry_count
     part["error_message"] = entry.error_message
 
+def _apply_worker_completion(worker: WorkerStatus, rows_done: int, memory_mb: float, *, idle: bool) -> None:
+    if idle:
+        worker.state = "idle"
+        worker.current_table = ""
+        worker.current_partition_id = ""
+    worker.rows_processed += rows_done
+    worker.memory_mb = memory_mb
+    worker.throughput_rows_per_sec = float(rows_done)
+
 def _persist_ledger_if_needed(run_ledger_path: str | None, ledger: dict[str, object]) -> None:
     if run_ledger_path is None or str(run_ledger_path).strip() == "":
         return
@@ -116,14 +210,69 @@ def _run_single_process_strategy(
     except PerformanceRunCancelled as exc:
         raise MultiprocessRunCancelled(str(exc)) from exc
 
-def run_generation_with_multiprocessing(
+def _run_fallback_strategy(
+    project: SchemaProject,
+    profile: PerformanceProfile,
+    config: MultiprocessConfig,
+    *,
+    reason: str,
+    partition_plan: list[PartitionPlanEntry],
+    worker_status: dict[int, WorkerStatus],
+    failures: list[PartitionFailure],
+    ledger: dict[str, object],
+    events: _EventBuffer,
+    processed_rows: int,
+    total_rows: int,
+    output_csv_folder: str | None,
+    output_sqlite_path: str | None,
+    cancel_requested: Callable[[], bool] | None,
+) -> MultiprocessRunResult:
+    for status in worker_status.values():
+        status.state = "fallback"
+        status.last_heartbeat_epoch = time.time()
+    events.emit(
+        MultiprocessEvent(
+            kind="fallback",
+            message=reason,
+            rows_processed=processed_rows,
+            total_rows=total_rows,
+        ),
+    )
+    strategy_result = _run_single_process_strategy(
+        project,
+        profile,
+        output_csv_folder=output_csv_folder,
+        output_sqlite_path=output_sqlite_path,
+        cancel_requested=cancel_requested,
+    )
+    events.emit_sync(
+        MultiprocessEvent(
+            kind="run_done",
+            rows_processed=strategy_result.total_rows,
+            total_rows=strategy_result.total_rows,
+            message="Fallback single-process run complete.",
+        ),
+    )
+    return MultiprocessRunResult(
+        mode=config.mode,
+        fallback_used=True,
+        partition_plan=partition_plan,
+        worker_status=worker_status,
+        failures=failures,
+        strategy_result=strategy_result,
+        total_rows=strategy_result.total_rows,
+        run_ledger=ledger,
+    )
+
+def _run_generation_with_event_buffer(
     project: SchemaProject,
     profile: PerformanceProfile,
     config: MultiprocessConfig,
     *,
     output_csv_folder: str | None = None,
     output_sqlite_path: str | None = None,
-    on_event: Callable[[MultiprocessEvent], None] | None = None,
+    events: _EventBuffer,
+    ledger_commits: _LedgerCommitCoordinator,
     cancel_requested: Callable[[], bool] | None = None,
     fallback_to_single_process: bool = False,
     run_ledger: dict[str, object] | None = None,
@@ -133,10 +282,11 @@ def run_generation_with_multiprocessing(
     validate_performance_profile(project, profile)
     validate_multiprocess_config(config)
 
-    partition_plan = build_partition_plan(project, profile, config)
+    # With ledger_persist_policy="never" nothing is written, so the path is not prepared or probed.
+    ledger_path = _prepare_ledger_path(run_ledger_path) if ledger_commits.enabled else None
+    partition_plan = _build_partition_plan(project, profile, config)
     worker_status = build_worker_status_snapshot(config)
     failures: list[PartitionFailure] = []
-    total_rows = sum(entry.rows_in_partition for entry in partition_plan)
 
     if run_ledger is None:
         ledger = create_run_ledger(project, profile, config, partition_plan)
@@ -145,9 +295,11 @@ def run_generation_with_multiprocessing(
         ledger = run_ledger
         apply_run_ledger_to_plan(partition_plan, ledger)
 
-    _persist_ledger_if_needed(run_ledger_path, ledger)
-    _emit_event(
-        on_event,
+    ledger_views = _ledger_partition_views(ledger, partition_plan)
+    total_rows, processed_rows, stage_groups = _summarize_partition_plan(partition_plan)
+    progress = _ProgressThrottle(total_rows)
+    ledger_commits.start(ledger_path, ledger)
+    events.emit(
         MultiprocessEvent(
             kind="started",
             total_rows=total_rows,
@@ -155,32 +307,26 @@ def run_generation_with_multiprocessing(
         ),
     )
 
-    processed_rows = 0
-    for entry in partition_plan:
-        if entry.status == "done":
-            processed_rows += entry.rows_in_partition
-
     if config.mode == "single_process":
         for entry in partition_plan:
             if entry.status == "done":
                 continue
             _ensure_not_cancelled(cancel_requested, "single-process partition sweep")
             entry.status = "done"
-            _update_ledger_partition(ledger, entry)
-            _persist_ledger_if_needed(run_ledger_path, ledger)
+            ledger_commits.commit_partition(ledger_views[entry.partition_id], entry)
             processed_rows += entry.rows_in_partition
-            _emit_event(
-                on_event,
-                MultiprocessEvent(
-                    kind="progress",
-                    partition_id=entry.partition_id,
-                    table_name=entry.table_name,
-                    worker_id=1,
-                    rows_processed=processed_rows,
-                    total_rows=total_rows,
-                    message="Single-process partition progress.",
-                ),
-            )
+            if progress.should_emit(processed_rows):
+                events.emit(
+                    MultiprocessEvent(
+                        kind="progress",
+                        partition_id=entry.partition_id,
+                        table_name=entry.table_name,
+                        worker_id=1,
+                        rows_processed=processed_rows,
+                        total_rows=total_rows,
+                        message="Single-process partition progress.",
+                    ),
+                )
 
         strategy_result = _run_single_process_strategy(
             project,
@@ -189,8 +335,7 @@ def run_generation_with_multiprocessing(
             output_sqlite_path=output_sqlite_path,
             cancel_requested=cancel_requested,
         )
-        _emit_event(
-            on_event,
+        events.emit_sync(
             MultiprocessEvent(
                 kind="run_done",
                 rows_processed=strategy_result.total_rows,
@@ -210,112 +355,112 @@ def run_generation_with_multiprocessing(
         )
 
     forced_failures = set(fail_partition_ids or set())
-    stage_groups = _group_by_stage(partition_plan)
-
-    def fallback_strategy(reason: str) -> MultiprocessRunResult:
-        for status in worker_status.values():
-            status.state = "fallback"
-            status.last_heartbeat_epoch = time.time()
-        _emit_event(
-            on_event,
-            MultiprocessEvent(
-                kind="fallback",
-                message=reason,
-                rows_processed=processed_rows,
-                total_rows=total_rows,
-            ),
-        )
-        strategy_result = _run_single_process_strategy(
-            project,
-            profile,
-            output_csv_folder=output_csv_folder,
-            output_sqlite_path=output_sqlite_path,
-            cancel_requested=cancel_requested,
-        )
-        _emit_event(
-            on_event,
-            MultiprocessEvent(
-                kind="run_done",
-                rows_processed=strategy_result.total_rows,
-                total_rows=strategy_result.total_rows,
-                message="Fallback single-process run complete.",
-            ),
-        )
-        return MultiprocessRunResult(
-            mode=config.mode,
-            fallback_used=True,
-            partition_plan=partition_plan,
-            worker_status=worker_status,
-            failures=failures,
-            strategy_result=strategy_result,
-            total_rows=strategy_result.total_rows,
-            run_ledger=ledger,
-        )
 
+    completion_ewma: float | None = None
     try:
         for stage in sorted(stage_groups):
-            stage_entries = [entry for entry in stage_groups[stage] if entry.status != "done"]
-            if not stage_entries:
+            pending = deque(entry for entry in stage_groups[stage] if entry.status != "done")
+            if not pending:
                 continue
 
-            pending = list(stage_entries)
-            inflight: dict[concurrent.futures.Future[dict[str, object]], PartitionPlanEntry] = {}
-
-            with concurrent.futures.ProcessPoolExecutor(max_workers=config.worker_count) as executor:
+            cancel_phase = f"stage {stage} execution"
+            inflight: dict[concurrent.futures.Future[list[_PartitionOutcome | Exception]], list[PartitionPlanEntry]] = {}
+            submitted_at: dict[concurrent.futures.Future[list[_PartitionOutcome | Exception]], float] = {}
+            inflight_partitions = 0
+            running_workers: set[int] = set()
+            worker_inflight = dict.fromkeys(worker_status, 0)
+
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=config.worker_count,
+                mp_context=_worker_pool_context(),
+                initializer=_worker_init,
+            ) as executor:
                 while pending or inflight:
-                    _ensure_not_cancelled(cancel_requested, f"stage {stage} execution")
+                    _ensure_not_cancelled(cancel_requested, cancel_phase)
 
-                    while pending and len(inflight) < config.max_inflight_chunks:
-                        entry = pending.pop(0)
-                        worker = worker_status[entry.assigned_worker]
+                    inflight_cap = _adaptive_inflight_cap(config, completion_ewma)
+                    while pending and inflight_partitions < inflight_cap:
+                        batch_size = min(
+                            _partition_batch_size(len(pending), config.worker_count),
+                            inflight_cap - inflight_partitions,
+                        )
+                        worker_id = _claim_worker_slot(pending[0].assigned_worker, worker_inflight)
+                        worker = worker_status[worker_id]
                         worker.state = "running"
-                        worker.current_table = entry.table_name
-                        worker.current_partition_id = entry.partition_id
+                        running_workers.add(worker_id)
                         worker.last_heartbeat_epoch = time.time()
 
-                        task = _PartitionTask(
-                            partition_id=entry.partition_id,
-                            table_name=entry.table_name,
-                            start_row=entry.start_row,
-                            end_row=entry.end_row,
-                            partition_seed=derive_partition_seed(
-                                project.seed,
-                                entry.table_name,
-                                entry.partition_id,
-                            ),
-                            force_fail=(
-                                entry.partition_id in forced_failures and entry.retry_count == 0
-                            ),
-                        )
-                        entry.status = "running"
-                        _update_ledger_partition(ledger, entry)
-                        _persist_ledger_if_needed(run_ledger_path, ledger)
-                        future = executor.submit(_run_partition_task, task)
-                        inflight[future] = entry
+                        batch_entries: list[PartitionPlanEntry] = []
+                        batch_tasks: list[_PartitionTask] = []
+                        for _ in range(batch_size):
+                            entry = pending.popleft()
+                            entry.assigned_worker = worker_id
+                            worker.current_table = entry.table_name
+                            worker.current_partition_id = entry.partition_id
+                            batch_tasks.append(
+                                _PartitionTask(
+                                    partition_id=entry.partition_id,
+                                    table_name=entry.table_name,
+                                    start_row=entry.start_row,
+                                    end_row=entry.end_row,
+                                    partition_seed=derive_partition_seed(
+                                        project.seed,
+                                        entry.table_name,
+                                        entry.partition_id,
+                                    ),
+                                    force_fail=(
+                                        entry.partition_id in forced_failures and entry.retry_count == 0
+                                    ),
+                                )
+                            )
+                            entry.status = "running"
+                            ledger_commits.commit_partition(ledger_views[entry.partition_id], entry)
+                            batch_entries.append(entry)
+
+                        worker_inflight[worker_id] += len(batch_entries)
+                        future = executor.submit(_run_partition_batch, tuple(batch_tasks))
+                        inflight[future] = batch_entries
+                        inflight_partitions += len(batch_entries)
+                        submitted_at[future] = time.perf_counter()
 
                     if not inflight:
                         continue
 
                     done, _ = concurrent.futures.wait(
-                        tuple(inflight.keys()),
+                        inflight,
                         timeout=0.2,
                         return_when=concurrent.futures.FIRST_COMPLETED,
                     )
                     if not done:
                         now = time.time()
-                        for worker in worker_status.values():
-                            if worker.state == "running":
-                                worker.last_heartbeat_epoch = now
+                        for worker_id in running_workers:
+                            worker_status[worker_id].last_heartbeat_epoch = now
                         continue
 
+                    completed: list[tuple[PartitionPlanEntry, dict[str, object] | Exception]] = []
                     for future in done:
-                        entry = inflight.pop(future)
+                        batch_entries = inflight.pop(future)
+                        inflight_partitions -= len(batch_entries)
+                        completion_ewma = _update_completion_ewma(
+                            completion_ewma,
+                            (time.perf_counter() - submitted_at.pop(future)) / len(batch_entries),
+                        )
+                        try:
+                            outcomes = future.result()
+                        except Exception as exc:
+                            outcomes = [exc] * len(batch_entries)
+                        completed.extend(zip(batch_entries, outcomes))
+
+                    for entry, outcome in completed:
                         worker = worker_status[entry.assigned_worker]
                         worker.last_heartbeat_epoch = time.time()
+                        worker_inflight[entry.assigned_worker] -= 1
+                        worker_idle = worker_inflight[entry.assigned_worker] == 0
+                        if worker_idle:
+                            running_workers.discard(entry.assigned_worker)
 
-                        try:
-                            result = future.result()
-                        except Exception as exc:
+                        if isinstance(outcome, Exception):
+                            exc = outcome
                             entry.error_message = str(exc)
                             entry.retry_count += 1
                             retry_action = "retry" if entry.retry_count <= config.retry_limit else "failed"
@@ -331,11 +476,10 @@ def run_generation_with_multiprocessing(
                             if entry.retry_count <= config.retry_limit:
                                 entry.status = "pending"
                                 worker.state = "retrying"
-                                _update_ledger_partition(ledger, entry)
-                                _persist_ledger_if_needed(run_ledger_path, ledger)
+                                ledger_commits.commit_partition(ledger_views[entry.partition_id], entry)
+                                ledger_commits.flush(wait=True)
                                 pending.append(entry)
-                                _emit_event(
-                                    on_event,
+                                events.emit_sync(
                                     MultiprocessEvent(
                                         kind="partition_failed",
                                         partition_id=entry.partition_id,
@@ -354,8 +498,8 @@ def run_generation_with_multiprocessing(
 
                             entry.status = "failed"
                             worker.state = "failed"
-                            _update_ledger_partition(ledger, entry)
-                            _persist_ledger_if_needed(run_ledger_path, ledger)
+                            ledger_commits.commit_partition(ledger_views[entry.partition_id], entry)
+                            ledger_commits.flush(wait=True)
 
                             raise ValueError(
                                 _orchestrator_error(
@@ -368,39 +512,58 @@ def run_generation_with_multiprocessing(
                                 )
                             ) from exc
 
-                        rows_done = int(result.get("rows_processed", entry.rows_in_partition))
+                        memory_mb = outcome[2]
+                        rows_done = entry.rows_in_partition
                         entry.status = "done"
                         entry.error_message = ""
                         processed_rows += rows_done
 
-                        worker.state = "idle"
-                        worker.current_table = ""
-                        worker.current_partition_id = ""
-                        worker.rows_processed += rows_done
-                        worker.memory_mb = float(result.get("memory_mb", 0.0))
-                        worker.throughput_rows_per_sec = float(rows_done)
-
-                        _update_ledger_partition(ledger, entry)
-                        _persist_ledger_if_needed(run_ledger_path, ledger)
-                        _emit_event(
-                            on_event,
-                            MultiprocessEvent(
-                                kind="progress",
-                                partition_id=entry.partition_id,
-                                table_name=entry.table_name,
-                                worker_id=entry.assigned_worker,
-                                rows_processed=processed_rows,
-                                total_rows=total_rows,
-                                message="Multiprocess partition progress.",
-                            ),
+                        _apply_worker_completion(
+                            worker,
+                            rows_done,
+                            memory_mb,
+                            idle=worker_idle,
                         )
 
-    except MultiprocessRunCancelled:
-        raise
+                        ledger_commits.commit_partition(ledger_views[entry.partition_id], entry)
+                        if progress.should_emit(processed_rows):
+                            events.emit(
+                                MultiprocessEvent(
+                                    kind="progress",
+                                    partition_id=entry.partition_id,
+                                    table_name=entry.table_name,
+                                    worker_id=entry.assigned_worker,
+                                    rows_processed=processed_rows,
+                                    total_rows=total_rows,
+                                    message="Multiprocess partition progress.",
+                                ),
+                            )
+
     except ValueError as exc:
-        if fallback_to_single_process:
-            return fallback_strategy(str(exc))
-        raise
+        # MultiprocessRunCancelled is a RuntimeError, so cancellation never reaches this handler.
+        if not fallback_to_single_process:
+            raise
+        return _run_fallback_strategy(
+            project,
+            profile,
+            config,
+            reason=str(exc),
+            partition_plan=partition_plan,
+            worker_status=worker_status,
+            failures=failures,
+            ledger=ledger,
+            events=events,
+            processed_rows=processed_rows,
+            total_rows=total_rows,
+            output_csv_folder=output_csv_folder,
+            output_sqlite_path=output_sqlite_path,
+            cancel_requested=cancel_requested,
+        )
+
+    if completion_ewma is not None:
+        ledger["task_completion_ewma_seconds"] = round(completion_ewma, 6)
+        ledger_commits.mark_dirty()
+    ledger_commits.flush()
 
     _ensure_not_cancelled(cancel_requested, "strategy generation")
     strategy_result = _run_single_process_strategy(
@@ -411,8 +574,7 @@ def run_generation_with_multiprocessing(
         cancel_requested=cancel_requested,
     )
 
-    _emit_event(
-        on_event,
+    events.emit_sync(
         MultiprocessEvent(
             kind="run_done",
             rows_processed=strategy_result.total_rows,
@@ -431,3 +593,46 @@ def run_generation_with_multiprocessing(
         total_rows=strategy_result.total_rows,
         run_ledger=ledger,
     )
+
+def run_generation_with_multiprocessing(
+    project: SchemaProject,
+    profile: PerformanceProfile,
+    config: MultiprocessConfig,
+    *,
+    output_csv_folder: str | None = None,
+    output_sqlite_path: str | None = None,
+    on_event: Callable[[MultiprocessEvent], None] | None = None,
+    cancel_requested: Callable[[], bool] | None = None,
+    fallback_to_single_process: bool = False,
+    run_ledger: dict[str, object] | None = None,
+    run_ledger_path: str | None = None,
+    fail_partition_ids: set[str] | None = None,
+) -> MultiprocessRunResult:
+    events = _EventBuffer(on_event, capacity=config.ipc_queue_size)
+    ledger_commits = _ledger_commit_coordinator(config.ledger_persist_policy)
+    try:
+        result = _run_generation_with_event_buffer(
+            project,
+            profile,
+            config,
+            events=events,
+            ledger_commits=ledger_commits,
+            output_csv_folder=output_csv_folder,
+            output_sqlite_path=output_sqlite_path,
+            cancel_requested=cancel_requested,
+            fallback_to_single_process=fallback_to_single_process,
+            run_ledger=run_ledger,
+            run_ledger_path=run_ledger_path,
+            fail_partition_ids=fail_partition_ids,
+        )
+    except BaseException:
+        # The run's own error wins; a ledger write failing while unwinding must not replace it.
+        with contextlib.suppress(Exception):
+            ledger_commits.close()
+        events.close()
+        raise
+    try:
+        ledger_commits.close()
+    finally:
+        events.close()
+    return result
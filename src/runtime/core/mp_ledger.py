@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
+import zlib
 from pathlib import Path
 
 from src.performance_scaling import PerformanceProfile
@@ -35,33 +39,431 @@ def create_run_ledger(
         },
     }
 
-def save_run_ledger(path_value: str, ledger: dict[str, object]) -> Path:
+def _parse_ledger_path(path_value: str | Path | None) -> Path | None:
+    if path_value is None:
+        return None
     path_text = str(path_value).strip()
     if path_text == "":
+        return None
+    return Path(path_text).expanduser()
+
+def _ledger_write_error(exc: OSError) -> ValueError:
+    return ValueError(
+        _orchestrator_error(
+            "Run ledger",
+            f"could not write ledger file ({exc})",
+            "choose a writable output path",
+        )
+    )
+
+def _prepare_ledger_path(path_value: str | Path | None) -> Path | None:
+    path = _parse_ledger_path(path_value)
+    if path is None:
+        return None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        raise _ledger_write_error(exc) from exc
+    if not os.access(path.parent, os.W_OK):
         raise ValueError(
             _orchestrator_error(
                 "Run ledger",
-                "output path is required",
-                "choose a writable JSON file path",
+                f"output folder '{path.parent}' is not writable",
+                "choose a writable output path",
             )
         )
-    path = Path(path_text)
+    return path
+
+_COMPACT_LEDGER_ENCODER = json.JSONEncoder(separators=(",", ":"), check_circular=False)
+
+def _serialize_run_ledger(ledger: dict[str, object], *, pretty: bool = False) -> bytes:
+    if pretty:
+        return json.dumps(ledger, indent=2).encode("utf-8")
+    return _COMPACT_LEDGER_ENCODER.encode(ledger).encode("utf-8")
+
+def _write_ledger_bytes(path: Path, data: bytes) -> Path:
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(ledger, indent=2), encoding="utf-8")
+        path.write_bytes(data)
+    except OSError as exc:
+        raise _ledger_write_error(exc) from exc
+    return path
+
+def _write_run_ledger(path: Path, ledger: dict[str, object], *, pretty: bool = False) -> Path:
+    return _write_ledger_bytes(path, _serialize_run_ledger(ledger, pretty=pretty))
+
+def _ledger_journal_path(path: Path) -> Path:
+    return path.with_name(path.name + ".journal")
+
+def _frame_crc(payload: bytes) -> int:
+    return zlib.crc32(payload)
+
+def _journal_frame(payload: bytes) -> bytes:
+    return b"%08x %s\n" % (_frame_crc(payload), payload)
+
+def _parse_journal_frame(line: bytes) -> bytes | None:
+    crc_text, separator, payload = line.partition(b" ")
+    if separator != b" " or len(crc_text) != 8:
+        return None
+    try:
+        expected = int(crc_text, 16)
+    except ValueError:
+        return None
+    if _frame_crc(payload) != expected:
+        return None
+    return payload
+
+def _serialize_journal_records(
+    partitions: dict[str, object],
+    partition_ids: set[str],
+) -> list[bytes]:
+    encode = _COMPACT_LEDGER_ENCODER.encode
+    frames = []
+    for partition_id in partition_ids:
+        view = partitions.get(partition_id)
+        if not isinstance(view, dict):
+            continue
+        payload = encode(
+            {
+                "partition_id": partition_id,
+                "status": view.get("status"),
+                "retry_count": view.get("retry_count"),
+                "error_message": view.get("error_message"),
+            }
+        ).encode("utf-8")
+        frames.append(_journal_frame(payload))
+    return frames
+
+_JOURNAL_IOV_MAX = 1024
+
+def _write_frames(fd: int, frames: list[bytes]) -> None:
+    writev = getattr(os, "writev", None)
+    for start in range(0, len(frames), _JOURNAL_IOV_MAX):
+        batch = frames[start : start + _JOURNAL_IOV_MAX]
+        written = writev(fd, batch) if writev is not None else 0
+        remaining = b"".join(batch)[written:] if written < sum(map(len, batch)) else b""
+        while remaining:
+            remaining = remaining[os.write(fd, remaining) :]
+
+def _append_ledger_journal(path: Path, frames: list[bytes]) -> None:
+    """Append journal frames with one vectored write per ``_JOURNAL_IOV_MAX`` frames."""
+    if not frames:
+        return
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            _write_frames(fd, frames)
+        finally:
+            os.close(fd)
+    except OSError as exc:
+        raise _ledger_write_error(exc) from exc
+
+def _discard_ledger_journal(path: Path) -> None:
+    try:
+        _ledger_journal_path(path).unlink(missing_ok=True)
+    except OSError as exc:
+        raise _ledger_write_error(exc) from exc
+
+def _apply_ledger_writes(
+    snapshot: tuple[Path, bytes] | None,
+    journal_path: Path | None,
+    journal_frames: list[bytes],
+) -> None:
+    if snapshot is not None:
+        path, data = snapshot
+        _write_ledger_bytes(path, data)
+        _discard_ledger_journal(path)
+    if journal_path is not None and journal_frames:
+        _append_ledger_journal(journal_path, journal_frames)
+
+def _replay_ledger_journal(path: Path, partitions: dict[str, object]) -> int:
+    """Apply journal frames written since the last snapshot, stopping at the first torn or corrupt frame."""
+    journal_path = _ledger_journal_path(path)
+    try:
+        raw = journal_path.read_bytes()
+    except FileNotFoundError:
+        return 0
     except OSError as exc:
         raise ValueError(
             _orchestrator_error(
                 "Run ledger",
-                f"could not write ledger file ({exc})",
-                "choose a writable output path",
+                f"failed to read ledger journal ({exc})",
+                "remove the damaged '.journal' file next to the ledger",
             )
         ) from exc
+    applied = 0
+    for line in raw.splitlines():
+        payload = _parse_journal_frame(line)
+        if payload is None:
+            break
+        try:
+            record = json.loads(payload)
+        except ValueError:
+            break
+        if not isinstance(record, dict):
+            break
+        partition_id = record.get("partition_id")
+        if not isinstance(partition_id, str):
+            continue
+        view = partitions.get(partition_id)
+        if not isinstance(view, dict):
+            view = {}
+            partitions[partition_id] = view
+        view["status"] = record.get("status")
+        view["retry_count"] = record.get("retry_count")
+        view["error_message"] = record.get("error_message")
+        applied += 1
+    return applied
+
+class _LedgerWriter:
+    """Write ledger snapshots and journal appends from a daemon thread so file I/O overlaps scheduling.
+
+    A pending snapshot supersedes journal records queued before it; records queued after
+    it are appended once it lands. Any exception raised by a write stops the thread and is
+    re-raised from the next ``submit``, ``append`` or ``drain`` call.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._snapshot: tuple[Path, bytes] | None = None
+        self._journal_path: Path | None = None
+        self._journal_frames: list[bytes] = []
+        self._closing = False
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = None
+
+    def submit(self, path: Path, data: bytes) -> None:
+        with self._condition:
+            self._raise_pending_error()
+            self._snapshot = (path, data)
+            self._journal_frames.clear()
+            self._wake_locked()
+
+    def append(self, journal_path: Path, frames: list[bytes]) -> None:
+        with self._condition:
+            self._raise_pending_error()
+            self._journal_path = journal_path
+            self._journal_frames.extend(frames)
+            self._wake_locked()
+
+    def drain(self) -> None:
+        with self._condition:
+            thread = self._thread
+            self._closing = True
+            self._condition.notify_all()
+        if thread is not None:
+            thread.join()
+        with self._condition:
+            self._thread = None
+            self._raise_pending_error()
+
+    def _wake_locked(self) -> None:
+        if self._thread is None:
+            self._closing = False
+            self._thread = threading.Thread(
+                target=self._write_loop,
+                name="mp-ledger-writer",
+                daemon=True,
+            )
+            self._thread.start()
+        self._condition.notify_all()
+
+    def _raise_pending_error(self) -> None:
+        if self._error is None:
+            return
+        error = self._error
+        self._error = None
+        raise error
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._condition:
+                while self._snapshot is None and not self._journal_frames and not self._closing:
+                    self._condition.wait()
+                if self._snapshot is None and not self._journal_frames:
+                    return
+                snapshot = self._snapshot
+                journal_path = self._journal_path
+                journal_frames = self._journal_frames
+                self._snapshot = None
+                self._journal_frames = []
+            try:
+                _apply_ledger_writes(snapshot, journal_path, journal_frames)
+            except BaseException as exc:  # surfaced to the scheduler on next submit/append/drain
+                with self._condition:
+                    self._error = exc
+                    self._snapshot = None
+                    self._journal_frames.clear()
+                return
+
+def _ledger_partition_views(
+    ledger: dict[str, object],
+    partition_plan: list[PartitionPlanEntry],
+) -> dict[str, dict[str, object]]:
+    partitions = ledger.get("partitions")
+    if not isinstance(partitions, dict):
+        partitions = {}
+        ledger["partitions"] = partitions
+    views: dict[str, dict[str, object]] = {}
+    for entry in partition_plan:
+        view = partitions.get(entry.partition_id)
+        if not isinstance(view, dict):
+            view = {}
+            partitions[entry.partition_id] = view
+        view["table_name"] = entry.table_name
+        view["stage"] = entry.stage
+        view["chunk_index"] = entry.chunk_index
+        _sync_ledger_view(view, entry)
+        views[entry.partition_id] = view
+    return views
+
+def _sync_ledger_view(view: dict[str, object], entry: PartitionPlanEntry) -> bool:
+    if (
+        view.get("status") == entry.status
+        and view.get("retry_count") == entry.retry_count
+        and view.get("error_message") == entry.error_message
+    ):
+        return False
+    view["status"] = entry.status
+    view["retry_count"] = entry.retry_count
+    view["error_message"] = entry.error_message
+    return True
+
+class _LedgerCommitCoordinator:
+    """Group-commit run-ledger writes: flush after ``max_batch`` changes or ``max_wait_seconds``.
+
+    With ``journal=True`` partition changes are appended to ``<ledger>.journal`` instead of
+    rewriting the whole ledger; a full snapshot is written at start, every
+    ``snapshot_every`` journal records, on metadata changes and on ``close`` (compaction).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_batch: int = 32,
+        max_wait_seconds: float = 0.5,
+        enabled: bool = True,
+        background: bool = False,
+        journal: bool = False,
+        snapshot_every: int = 10000,
+    ) -> None:
+        self.enabled = enabled
+        self.journal = journal
+        self._writer = _LedgerWriter() if background else None
+        self.max_batch = max(1, int(max_batch))
+        self.max_wait_seconds = max(0.0, float(max_wait_seconds))
+        self.snapshot_every = max(1, int(snapshot_every))
+        self._path: Path | None = None
+        self._journal_path: Path | None = None
+        self._ledger: dict[str, object] | None = None
+        self._dirty = 0
+        self._snapshot_due = False
+        self._journal_records = 0
+        self._last_flush = 0.0
+        self.dirty_partition_ids: set[str] = set()
+
+    def start(self, path: Path | None, ledger: dict[str, object]) -> None:
+        self._path = path if self.enabled else None
+        self._journal_path = _ledger_journal_path(path) if self.journal and self._path is not None else None
+        self._ledger = ledger
+        self._dirty = 1
+        self._snapshot_due = True
+        self.flush()
+
+    def mark_dirty(self, partition_id: str | None = None) -> None:
+        if self._path is None:
+            return
+        if partition_id is None:
+            self._snapshot_due = True
+        else:
+            self.dirty_partition_ids.add(partition_id)
+        self._dirty += 1
+        if self._dirty >= self.max_batch or (time.perf_counter() - self._last_flush) >= self.max_wait_seconds:
+            self.flush()
+
+    def commit_partition(self, view: dict[str, object], entry: PartitionPlanEntry) -> None:
+        if _sync_ledger_view(view, entry):
+            self.mark_dirty(entry.partition_id)
+
+    def flush(self, *, wait: bool = False) -> None:
+        """Write pending changes; ``wait=True`` also blocks until background writes have landed."""
+        if self._path is not None and self._ledger is not None and self._dirty != 0:
+            if (
+                self._journal_path is None
+                or self._snapshot_due
+                or self._journal_records + len(self.dirty_partition_ids) > self.snapshot_every
+            ):
+                self._write_snapshot()
+            else:
+                self._append_journal()
+            self.dirty_partition_ids.clear()
+            self._dirty = 0
+            self._last_flush = time.perf_counter()
+        if wait and self._writer is not None:
+            self._writer.drain()
+
+    def close(self) -> None:
+        """Flush pending changes, compact the journal and wait for background writes to land."""
+        try:
+            if self._journal_records > 0 or self.dirty_partition_ids:
+                self._snapshot_due = True
+                self._dirty = max(self._dirty, 1)
+            self.flush()
+        finally:
+            if self._writer is not None:
+                self._writer.drain()
+
+    def _write_snapshot(self) -> None:
+        if self._path is None or self._ledger is None:
+            return
+        if self._writer is None:
+            _write_run_ledger(self._path, self._ledger)
+            _discard_ledger_journal(self._path)
+        else:
+            self._writer.submit(self._path, _serialize_run_ledger(self._ledger))
+        self._snapshot_due = False
+        self._journal_records = 0
+
+    def _append_journal(self) -> None:
+        if self._journal_path is None or self._ledger is None:
+            return
+        partitions = self._ledger.get("partitions")
+        if not isinstance(partitions, dict) or not self.dirty_partition_ids:
+            return
+        frames = _serialize_journal_records(partitions, self.dirty_partition_ids)
+        if self._writer is None:
+            _append_ledger_journal(self._journal_path, frames)
+        else:
+            self._writer.append(self._journal_path, frames)
+        self._journal_records += len(self.dirty_partition_ids)
+
+def _ledger_commit_coordinator(policy: str) -> _LedgerCommitCoordinator:
+    if policy == "always":
+        return _LedgerCommitCoordinator(max_batch=1, max_wait_seconds=0.0, journal=True)
+    if policy == "never":
+        return _LedgerCommitCoordinator(enabled=False)
+    return _LedgerCommitCoordinator(background=True, journal=True)
+
+def save_run_ledger(path_value: str, ledger: dict[str, object], *, pretty: bool = False) -> Path:
+    path = _parse_ledger_path(path_value)
+    if path is None:
+        raise ValueError(
+            _orchestrator_error(
+                "Run ledger",
+                "output path is required",
+                "choose a writable JSON file path",
+            )
+        )
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        raise _ledger_write_error(exc) from exc
+    _write_run_ledger(path, ledger, pretty=pretty)
+    _discard_ledger_journal(path)
     return path
 
 def load_run_ledger(path_value: str) -> dict[str, object]:
-    path_text = str(path_value).strip()
-    if path_text == "":
+    path = _parse_ledger_path(path_value)
+    if path is None:
         raise ValueError(
             _orchestrator_error(
                 "Run ledger",
@@ -69,12 +471,11 @@ def load_run_ledger(path_value: str) -> dict[str, object]:
                 "choose an existing ledger JSON file",
             )
         )
-    path = Path(path_text)
     if not path.exists() or not path.is_file():
         raise ValueError(
             _orchestrator_error(
                 "Run ledger",
-                f"ledger file '{path_text}' does not exist",
+                f"ledger file '{str(path_value).strip()}' does not exist",
                 "choose an existing ledger JSON file",
             )
         )
@@ -105,6 +506,7 @@ def load_run_ledger(path_value: str) -> dict[str, object]:
                 "include a partitions object keyed by partition_id",
             )
         )
+    _replay_ledger_journal(path, partitions)
     return payload
 
 def validate_run_ledger(
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
+import os
 import time
+from collections import deque
 from dataclasses import replace
 
-from src.performance_scaling import PerformanceProfile, build_chunk_plan, validate_performance_profile
+from src.performance_scaling import PerformanceProfile, _build_chunk_plan_core, validate_performance_profile
 from src.schema_project_model import SchemaProject
 from src.runtime.core.mp_config import _orchestrator_error, validate_multiprocess_config
 from src.runtime.core.mp_types import MultiprocessConfig, PartitionPlanEntry, WorkerStatus
 
+ROUND_ROBIN_ASSIGNMENT_ENV_VAR = "GDA_MP_ROUND_ROBIN_ASSIGNMENT"
+
+def _round_robin_assignment_enabled() -> bool:
+    raw = str(os.environ.get(ROUND_ROBIN_ASSIGNMENT_ENV_VAR, "")).strip().lower()
+    return raw in {"1", "true", "yes", "on"}
+
 def _topological_selected_table_order(
     project: SchemaProject,
     selected_tables: set[str],
@@ -29,16 +38,15 @@ def _topological_selected_table_order(
     ordered: list[str] = []
 
     while ready:
-        current = ready.pop(0)
+        current = heapq.heappop(ready)
         ordered.append(current)
-        for child in sorted(children_by_parent[current]):
+        for child in children_by_parent[current]:
             indegree[child] -= 1
             if indegree[child] == 0:
-                ready.append(child)
-                ready.sort()
+                heapq.heappush(ready, child)
 
     if len(ordered) != len(selected_tables):
-        unresolved = sorted(name for name in selected_tables if name not in ordered)
+        unresolved = sorted(name for name, degree in indegree.items() if degree > 0)
         unresolved_text = ", ".join(unresolved)
         raise ValueError(
             _orchestrator_error(
@@ -59,14 +67,12 @@ def _selected_tables_with_required_parents(
     for fk in project.foreign_keys:
         parent_by_child.setdefault(fk.child_table, set()).add(fk.parent_table)
 
-    changed = True
-    while changed:
-        changed = False
-        for table_name in list(selected):
-            for parent_name in parent_by_child.get(table_name, set()):
-                if parent_name not in selected:
-                    selected.add(parent_name)
-                    changed = True
+    queue = deque(selected)
+    while queue:
+        for parent_name in parent_by_child.get(queue.popleft(), ()):
+            if parent_name not in selected:
+                selected.add(parent_name)
+                queue.append(parent_name)
 
     return _topological_selected_table_order(project, selected)
 
@@ -77,30 +83,49 @@ def build_partition_plan(
 ) -> list[PartitionPlanEntry]:
     validate_performance_profile(project, profile)
     validate_multiprocess_config(config)
+    return _build_partition_plan(project, profile, config)
 
+def _build_partition_plan(
+    project: SchemaProject,
+    profile: PerformanceProfile,
+    config: MultiprocessConfig,
+) -> list[PartitionPlanEntry]:
+    """Build the partition plan for a profile and config the caller has already validated."""
     selected_with_parents = _selected_tables_with_required_parents(project, profile)
     effective_profile = replace(profile, target_tables=selected_with_parents)
 
-    chunk_entries = build_chunk_plan(project, effective_profile)
+    chunk_entries = _build_chunk_plan_core(project, effective_profile)
     worker_count = 1 if config.mode == "single_process" else config.worker_count
 
-    out: list[PartitionPlanEntry] = []
-    for idx, chunk in enumerate(chunk_entries, start=1):
-        partition_id = f"{chunk.table_name}|stage={chunk.stage}|chunk={chunk.chunk_index}"
-        assigned_worker = ((idx - 1) % worker_count) + 1
-        out.append(
-            PartitionPlanEntry(
-                partition_id=partition_id,
-                table_name=chunk.table_name,
-                stage=chunk.stage,
-                chunk_index=chunk.chunk_index,
-                start_row=chunk.start_row,
-                end_row=chunk.end_row,
-                rows_in_partition=chunk.rows_in_chunk,
-                assigned_worker=assigned_worker,
-            )
+    if _round_robin_assignment_enabled():
+        assigned_workers = [(idx % worker_count) + 1 for idx in range(len(chunk_entries))]
+    else:
+        # Split each stage's chunks (kept in plan order, so a table's chunks stay adjacent)
+        # into contiguous worker blocks. Blocking per stage rather than per table keeps
+        # single-chunk tables from all landing on worker 1.
+        chunks_per_stage: dict[int, int] = {}
+        for chunk in chunk_entries:
+            chunks_per_stage[chunk.stage] = chunks_per_stage.get(chunk.stage, 0) + 1
+        seen_in_stage: dict[int, int] = {}
+        assigned_workers = []
+        for chunk in chunk_entries:
+            position = seen_in_stage.get(chunk.stage, 0)
+            seen_in_stage[chunk.stage] = position + 1
+            assigned_workers.append(((position * worker_count) // chunks_per_stage[chunk.stage]) + 1)
+
+    return [
+        PartitionPlanEntry(
+            partition_id=f"{chunk.table_name}|stage={chunk.stage}|chunk={chunk.chunk_index}",
+            table_name=chunk.table_name,
+            stage=chunk.stage,
+            chunk_index=chunk.chunk_index,
+            start_row=chunk.start_row,
+            end_row=chunk.end_row,
+            rows_in_partition=chunk.rows_in_chunk,
+            assigned_worker=assigned_worker,
         )
-    return out
+        for chunk, assigned_worker in zip(chunk_entries, assigned_workers)
+    ]
 
 def build_worker_status_snapshot(config: MultiprocessConfig) -> dict[int, WorkerStatus]:
     worker_count = 1 if config.mode == "single_process" else config.worker_count
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 EXECUTION_MODES: tuple[str, ...] = ("single_process", "multi_process_local")
+LEDGER_PERSIST_POLICIES: tuple[str, ...] = ("batched", "always", "never")
 
 @dataclass(frozen=True)
 class MultiprocessConfig:
@@ -11,6 +12,7 @@ class MultiprocessConfig:
     max_inflight_chunks: int = 4
     ipc_queue_size: int = 128
     retry_limit: int = 1
+    ledger_persist_policy: str = LEDGER_PERSIST_POLICIES[0]
 
 @dataclass
 class PartitionPlanEntry:
@@ -44,7 +46,7 @@ class PartitionFailure:
     retry_count: int
     action: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MultiprocessEvent:
     kind: str
     message: str = ""
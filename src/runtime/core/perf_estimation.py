@@ -1,8 +1,17 @@
 from __future__ import annotations
 
 from src.schema_project_model import SchemaProject
+from src.runtime.core.perf_planning import _cache_lookup, _cache_store, _plan_cache_key
 from src.runtime.core.perf_types import PerformanceProfile, WorkloadEstimate, WorkloadSummary
 
+_WORKLOAD_ESTIMATE_CACHE: dict[tuple[object, ...], tuple[WorkloadEstimate, ...]] = {}
+
+_BYTES_PER_MB = 1024.0 * 1024.0
+_HIGH_RISK_RECOMMENDATION = "Reduce row overrides or split workload into smaller chunks."
+_MEDIUM_RISK_RECOMMENDATION = "Review chunk_size_rows and preview scope before full generation."
+_LOW_RISK_RECOMMENDATION = "Current profile is suitable for phase-1 guided execution."
+_LARGE_ROW_TARGET_RECOMMENDATION = "Row target is large relative to chunk size. Consider increasing chunk_size_rows."
+
 def _risk_priority(level: str) -> int:
     if level == "high":
         return 3
@@ -11,32 +20,41 @@ def _risk_priority(level: str) -> int:
     return 1
 
 def estimate_workload(project: SchemaProject, profile: PerformanceProfile) -> list[WorkloadEstimate]:
+    cache_key = _plan_cache_key(project, profile)
+    cached = _cache_lookup(_WORKLOAD_ESTIMATE_CACHE, cache_key)
+    if cached is not None:
+        return list(cached)
+
     table_map = {table.table_name: table for table in project.tables}
     selected = profile.target_tables or tuple(table.table_name for table in project.tables)
+    row_overrides = profile.row_overrides
+    large_row_threshold = profile.chunk_size_rows * 4
     estimates: list[WorkloadEstimate] = []
+    append = estimates.append
     for table_name in selected:
         table = table_map[table_name]
-        row_count = int(profile.row_overrides.get(table_name, table.row_count))
+        row_count = int(row_overrides.get(table_name, table.row_count))
         column_count = max(1, len(table.columns))
-        estimated_memory_mb = round((row_count * column_count * 48.0) / (1024.0 * 1024.0), 3)
-        estimated_write_mb = round((row_count * column_count * 24.0) / (1024.0 * 1024.0), 3)
+        cells = row_count * column_count
+        estimated_memory_mb = round((cells * 48.0) / _BYTES_PER_MB, 3)
+        estimated_write_mb = round((cells * 24.0) / _BYTES_PER_MB, 3)
         complexity_multiplier = 1.0 + (max(0, column_count - 4) * 0.08)
         estimated_seconds = round((row_count * complexity_multiplier) / 75_000.0, 3)
 
         if estimated_memory_mb >= 512.0 or estimated_seconds >= 20.0:
             risk = "high"
-            recommendation = "Reduce row overrides or split workload into smaller chunks."
+            recommendation = _HIGH_RISK_RECOMMENDATION
         elif estimated_memory_mb >= 128.0 or estimated_seconds >= 5.0:
             risk = "medium"
-            recommendation = "Review chunk_size_rows and preview scope before full generation."
+            recommendation = _MEDIUM_RISK_RECOMMENDATION
         else:
             risk = "low"
-            recommendation = "Current profile is suitable for phase-1 guided execution."
+            recommendation = _LOW_RISK_RECOMMENDATION
 
-        if row_count > (profile.chunk_size_rows * 4):
-            recommendation = "Row target is large relative to chunk size. Consider increasing chunk_size_rows."
+        if row_count > large_row_threshold:
+            recommendation = _LARGE_ROW_TARGET_RECOMMENDATION
 
-        estimates.append(
+        append(
             WorkloadEstimate(
                 table_name=table_name,
                 estimated_rows=row_count,
@@ -47,6 +65,7 @@ def estimate_workload(project: SchemaProject, profile: PerformanceProfile) -> li
                 recommendation=recommendation,
             )
         )
+    _cache_store(_WORKLOAD_ESTIMATE_CACHE, cache_key, tuple(estimates))
     return estimates
 
 def summarize_estimates(estimates: list[WorkloadEstimate]) -> WorkloadSummary:
@@ -58,11 +77,25 @@ def summarize_estimates(estimates: list[WorkloadEstimate]) -> WorkloadSummary:
             total_seconds=0.0,
             highest_risk="low",
         )
-    highest_risk = max((estimate.risk_level for estimate in estimates), key=_risk_priority)
+    total_rows = 0
+    total_memory_mb = 0.0
+    total_write_mb = 0.0
+    total_seconds = 0.0
+    highest_priority = 0
+    highest_risk = "low"
+    for estimate in estimates:
+        total_rows += estimate.estimated_rows
+        total_memory_mb += estimate.estimated_memory_mb
+        total_write_mb += estimate.estimated_write_mb
+        total_seconds += estimate.estimated_seconds
+        priority = _risk_priority(estimate.risk_level)
+        if priority > highest_priority:
+            highest_priority = priority
+            highest_risk = estimate.risk_level
     return WorkloadSummary(
-        total_rows=sum(estimate.estimated_rows for estimate in estimates),
-        total_memory_mb=round(sum(estimate.estimated_memory_mb for estimate in estimates), 3),
-        total_write_mb=round(sum(estimate.estimated_write_mb for estimate in estimates), 3),
-        total_seconds=round(sum(estimate.estimated_seconds for estimate in estimates), 3),
+        total_rows=total_rows,
+        total_memory_mb=round(total_memory_mb, 3),
+        total_write_mb=round(total_write_mb, 3),
+        total_seconds=round(total_seconds, 3),
         highest_risk=highest_risk,
     )
@@ -1,20 +1,21 @@
 from __future__ import annotations
 
-import base64
 import csv
 import os
+from binascii import b2a_base64
 from dataclasses import replace
+from operator import itemgetter
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
-from src.generator_project import generate_project_rows, generate_project_rows_streaming
+from src.generator_project import generate_project_rows_streaming
 from src.schema_project_model import SchemaProject, TableSpec
 from src.storage_sqlite_project import create_tables, insert_project_rows
 from src.runtime.core.perf_estimation import estimate_workload, summarize_estimates
 from src.runtime.core.perf_planning import (
+    _build_chunk_plan_core,
     _selected_table_names,
     _selected_tables_with_required_parents,
-    build_chunk_plan,
     summarize_chunk_plan,
     validate_performance_profile,
 )
@@ -28,6 +29,9 @@ from src.runtime.core.perf_types import (
     StrategyRunResult,
 )
 
+# Benchmark chunk walks poll ``cancel_requested`` once per this many chunks (power of two).
+_CANCEL_POLL_INTERVAL = 64
+
 def _clone_table_with_row_count(table: TableSpec, row_count: int) -> TableSpec:
     return TableSpec(
         table_name=table.table_name,
@@ -70,6 +74,27 @@ def _emit_event(on_event: Callable[[RuntimeEvent], None] | None, event: RuntimeE
         return
     on_event(event)
 
+def _progress_event(
+    table_name: str,
+    stage: int,
+    chunk_index: int,
+    total_chunks: int,
+    rows_processed: int,
+    total_rows: int,
+    message: str,
+) -> RuntimeEvent:
+    """Build a per-chunk progress event positionally, skipping keyword-argument packing."""
+    return RuntimeEvent(
+        "progress",
+        table_name,
+        stage,
+        chunk_index,
+        total_chunks,
+        rows_processed,
+        total_rows,
+        message,
+    )
+
 def _ensure_not_cancelled(cancel_requested: Callable[[], bool] | None, phase: str) -> None:
     if cancel_requested is None:
         return
@@ -95,7 +120,7 @@ def run_performance_benchmark(
     selected_tables = _selected_table_names(project, profile)
     estimates = estimate_workload(project, profile)
     estimate_summary = summarize_estimates(estimates)
-    chunk_plan = build_chunk_plan(project, profile)
+    chunk_plan = _build_chunk_plan_core(project, profile)
     chunk_summary = summarize_chunk_plan(chunk_plan)
 
     _emit_event(
@@ -109,21 +134,25 @@ def run_performance_benchmark(
     )
 
     rows_processed = 0
-    for entry in chunk_plan:
-        _ensure_not_cancelled(cancel_requested, "benchmark processing")
+    total_chunks = chunk_summary.total_chunks
+    total_rows = chunk_summary.total_rows
+    poll_mask = _CANCEL_POLL_INTERVAL - 1
+    for index, entry in enumerate(chunk_plan):
+        if index & poll_mask == 0:
+            _ensure_not_cancelled(cancel_requested, "benchmark processing")
         rows_processed += entry.rows_in_chunk
-        _emit_event(
-            on_event,
-            RuntimeEvent(
-                kind="progress",
-                table_name=entry.table_name,
-                stage=entry.stage,
-                chunk_index=entry.chunk_index,
-                total_chunks=chunk_summary.total_chunks,
-                rows_processed=rows_processed,
-                total_rows=chunk_summary.total_rows,
-                message="Benchmark progress.",
-            ),
+        if on_event is None:
+            continue
+        on_event(
+            _progress_event(
+                entry.table_name,
+                entry.stage,
+                entry.chunk_index,
+                total_chunks,
+                rows_processed,
+                total_rows,
+                "Benchmark progress.",
+            )
         )
 
     _emit_event(
@@ -145,11 +174,107 @@ def run_performance_benchmark(
         chunk_summary=chunk_summary,
     )
 
+# CSV exports hand the kernel 1 MiB writes instead of the default 8 KiB.
+_CSV_WRITE_BUFFER_BYTES = 1 << 20
+
 def _csv_export_value(value: object) -> object:
     if isinstance(value, bytes):
-        return base64.b64encode(value).decode("ascii")
+        return b2a_base64(value, newline=False).decode("ascii")
     return value
 
+def _csv_row_getter(
+    rows: list[dict[str, object]],
+    cols: list[str],
+) -> Callable[[dict[str, object]], tuple[object, ...]]:
+    # Rows normally all carry the header columns; only a ragged table pays for row.get,
+    # which writes a blank cell for a missing key.
+    header_keys = rows[0].keys()
+    if not all(row.keys() >= header_keys for row in rows):
+        return lambda row: tuple(map(row.get, cols))
+    if len(cols) == 1:
+        only_col = cols[0]
+        return lambda row: (row[only_col],)
+    return itemgetter(*cols)
+
+def _csv_bytes_column_indexes(
+    rows: list[dict[str, object]],
+    cols: list[str],
+    bytes_columns: frozenset[str] | None,
+) -> list[int]:
+    if bytes_columns is not None:
+        return [idx for idx, col in enumerate(cols) if col in bytes_columns]
+    return [idx for idx, col in enumerate(cols) if any(isinstance(row.get(col), bytes) for row in rows)]
+
+def _csv_batch(
+    rows: list[dict[str, object]],
+    getter: Callable[[dict[str, object]], tuple[object, ...]],
+    bytes_indexes: list[int],
+) -> list[tuple[object, ...]] | list[list[object]]:
+    batch = [getter(row) for row in rows]
+    if not bytes_indexes:
+        return batch
+    b64 = b2a_base64
+    encoded: list[list[object]] = []
+    for values in batch:
+        out = list(values)
+        for idx in bytes_indexes:
+            value = out[idx]
+            if isinstance(value, bytes):
+                out[idx] = b64(value, newline=False).decode("ascii")
+        encoded.append(out)
+    return encoded
+
+def _write_csv_chunk(
+    writer: Any,
+    rows: list[dict[str, object]],
+    getter: Callable[[dict[str, object]], tuple[object, ...]],
+    bytes_indexes: list[int],
+) -> None:
+    if bytes_indexes:
+        writer.writerows(_csv_batch(rows, getter, bytes_indexes))
+        return
+    # Feed the getter tuples straight to the C writer.
+    writer.writerows(map(getter, rows))
+
+def _write_csv_table(
+    table_name: str,
+    rows: list[dict[str, object]],
+    folder_path: Path,
+    *,
+    step: int,
+    bytes_columns: frozenset[str] | None,
+    on_event: Callable[[RuntimeEvent], None] | None,
+    cancel_requested: Callable[[], bool] | None,
+) -> str | None:
+    _ensure_not_cancelled(cancel_requested, f"CSV export ({table_name})")
+    if not rows:
+        return None
+    cols = list(rows[0].keys())
+    row_count = len(rows)
+    getter = _csv_row_getter(rows, cols)
+    bytes_indexes = _csv_bytes_column_indexes(rows, cols, bytes_columns)
+    out_file = folder_path / f"{table_name}.csv"
+    emit_enabled = on_event is not None
+    with out_file.open("w", newline="", encoding="utf-8", buffering=_CSV_WRITE_BUFFER_BYTES) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(cols)
+        for start in range(0, row_count, step):
+            stop = min(row_count, start + step)
+            _write_csv_chunk(writer, rows[start:stop], getter, bytes_indexes)
+            if stop % step == 0:
+                if emit_enabled:
+                    on_event(
+                        RuntimeEvent(
+                            kind="table_done",
+                            table_name=table_name,
+                            rows_processed=stop,
+                            total_rows=row_count,
+                            message=f"CSV export progress for {table_name}.",
+                        )
+                    )
+                _ensure_not_cancelled(cancel_requested, f"CSV export ({table_name})")
+    return os.fspath(out_file)
+
 def _write_rows_to_csv_folder(
     rows_by_table: dict[str, list[dict[str, object]]],
     table_order: tuple[str, ...],
@@ -158,44 +283,34 @@ def _write_rows_to_csv_folder(
     buffer_rows: int,
     on_event: Callable[[RuntimeEvent], None] | None = None,
     cancel_requested: Callable[[], bool] | None = None,
+    bytes_columns_by_table: dict[str, frozenset[str]] | None = None,
 ) -> dict[str, str]:
+    """Write each table's rows to ``<table>.csv``.
+
+    ``bytes_columns_by_table`` names the columns that may hold bytes (base64-encoded on
+    export); tables missing from it are scanned for bytes values instead.
+    """
     if output_folder.strip() == "":
         raise ValueError(_run_error("CSV output folder is required", "choose an output folder for CSV export"))
     folder_path = Path(output_folder)
     folder_path.mkdir(parents=True, exist_ok=True)
 
+    step = max(1, buffer_rows)
+    bytes_columns_by_table = bytes_columns_by_table or {}
+
     out_paths: dict[str, str] = {}
     for table_name in table_order:
-        _ensure_not_cancelled(cancel_requested, f"CSV export ({table_name})")
-        rows = rows_by_table.get(table_name, [])
-        if not rows:
-            continue
-        cols = list(rows[0].keys())
-        out_file = folder_path / f"{table_name}.csv"
-        with out_file.open("w", newline="", encoding="utf-8") as handle:
-            writer = csv.writer(handle)
-            writer.writerow(cols)
-            batch: list[list[object]] = []
-            for idx, row in enumerate(rows, start=1):
-                batch.append([_csv_export_value(row.get(col)) for col in cols])
-                if len(batch) >= buffer_rows:
-                    writer.writerows(batch)
-                    batch = []
-                if idx % max(1, buffer_rows) == 0:
-                    _emit_event(
-                        on_event,
-                        RuntimeEvent(
-                            kind="table_done",
-                            table_name=table_name,
-                            rows_processed=idx,
-                            total_rows=len(rows),
-                            message=f"CSV export progress for {table_name}.",
-                        ),
-                    )
-                    _ensure_not_cancelled(cancel_requested, f"CSV export ({table_name})")
-            if batch:
-                writer.writerows(batch)
-        out_paths[table_name] = os.fspath(out_file)
+        out_path = _write_csv_table(
+            table_name,
+            rows_by_table.get(table_name, []),
+            folder_path,
+            step=step,
+            bytes_columns=bytes_columns_by_table.get(table_name),
+            on_event=on_event,
+            cancel_requested=cancel_requested,
+        )
+        if out_path is not None:
+            out_paths[table_name] = out_path
     return out_paths
 
 def run_generation_with_strategy(
@@ -213,7 +328,7 @@ def run_generation_with_strategy(
     selected_tables = _selected_tables_with_required_parents(project, profile)
     selected_set = set(selected_tables)
     effective_profile = replace(profile, target_tables=selected_tables)
-    chunk_plan = build_chunk_plan(project, effective_profile)
+    chunk_plan = _build_chunk_plan_core(project, effective_profile)
     chunk_summary = summarize_chunk_plan(chunk_plan)
     chunk_entries_by_table: dict[str, list[ChunkPlanEntry]] = {}
     for entry in chunk_plan:
@@ -246,6 +361,10 @@ def run_generation_with_strategy(
     )
 
     runtime_project = _clone_project_with_row_overrides(project, profile.row_overrides)
+    bytes_columns_by_table = {
+        table.table_name: frozenset(column.name for column in table.columns if column.dtype == "bytes")
+        for table in runtime_project.tables
+    }
     rows_by_table: dict[str, list[dict[str, object]]] = {}
     csv_paths: dict[str, str] = {}
     sqlite_counts: dict[str, int] = {}
@@ -254,29 +373,37 @@ def run_generation_with_strategy(
 
     def _emit_progress_for_table(table_name: str) -> None:
         nonlocal rows_processed
-        for entry in chunk_entries_by_table.get(table_name, []):
+        table_entries = chunk_entries_by_table.get(table_name, [])
+        if on_event is None:
+            rows_processed += sum(entry.rows_in_chunk for entry in table_entries)
+            return
+        for entry in table_entries:
             rows_processed += entry.rows_in_chunk
-            _emit_event(
-                on_event,
-                RuntimeEvent(
-                    kind="progress",
-                    table_name=entry.table_name,
-                    stage=entry.stage,
-                    chunk_index=entry.chunk_index,
-                    total_chunks=chunk_summary.total_chunks,
-                    rows_processed=rows_processed,
-                    total_rows=chunk_summary.total_rows,
-                    message="Generation progress.",
-                ),
+            on_event(
+                _progress_event(
+                    entry.table_name,
+                    entry.stage,
+                    entry.chunk_index,
+                    chunk_summary.total_chunks,
+                    rows_processed,
+                    chunk_summary.total_rows,
+                    "Generation progress.",
+                )
             )
 
     if mode == "preview":
-        rows_by_table_full = generate_project_rows(runtime_project)
+        # Keep only the selected tables' rows as the generator emits them; parents that were
+        # pulled in for FK integrity are released once their children are generated.
+        generated_rows: dict[str, list[dict[str, object]]] = {}
+
+        def _on_preview_table(table_name: str, rows: list[dict[str, object]]) -> None:
+            if table_name in selected_set:
+                _ensure_not_cancelled(cancel_requested, f"table processing ({table_name})")
+                generated_rows[table_name] = rows
+
+        generate_project_rows_streaming(runtime_project, on_table_rows=_on_preview_table)
         _ensure_not_cancelled(cancel_requested, "post-generation")
-        rows_by_table = {
-            table_name: list(rows_by_table_full.get(table_name, []))
-            for table_name in selected_tables
-        }
+        rows_by_table = {table_name: generated_rows.get(table_name, []) for table_name in selected_tables}
         for table_name in selected_tables:
             _ensure_not_cancelled(cancel_requested, "chunk processing")
             _emit_progress_for_table(table_name)
@@ -305,6 +432,7 @@ def run_generation_with_strategy(
                     buffer_rows=profile.csv_buffer_rows,
                     on_event=on_event,
                     cancel_requested=cancel_requested,
+                    bytes_columns_by_table=bytes_columns_by_table,
                 )
                 csv_paths.update(table_paths)
 
@@ -1,9 +1,48 @@
 from __future__ import annotations
 
+import heapq
+import threading
+from collections import deque
+
 from src.schema_project_model import SchemaProject
 from src.runtime.core.perf_profile import _performance_error
 from src.runtime.core.perf_types import ChunkPlanEntry, ChunkPlanSummary, PerformanceProfile
 
+_PLAN_CACHE_MAX_ENTRIES = 32
+_CHUNK_PLAN_CACHE: dict[tuple[object, ...], tuple[ChunkPlanEntry, ...]] = {}
+_TOPOLOGICAL_ORDER_CACHE: dict[tuple[object, ...], tuple] = {}
+# GUI worker threads plan concurrently; the LRU reorder and eviction must not interleave.
+_PLAN_CACHE_LOCK = threading.Lock()
+
+def _plan_cache_key(project: SchemaProject, profile: PerformanceProfile) -> tuple[object, ...]:
+    """Key every project/profile field that planning, validation or estimation reads."""
+    return (
+        tuple((table.table_name, table.row_count, len(table.columns)) for table in project.tables),
+        tuple(
+            (fk.child_table, fk.child_column, fk.parent_table, fk.parent_column, fk.min_children)
+            for fk in project.foreign_keys
+        ),
+        profile.target_tables,
+        tuple(sorted(profile.row_overrides.items())),
+        profile.chunk_size_rows,
+        profile.preview_row_target,
+        profile.preview_page_size,
+        profile.strict_deterministic_chunking,
+    )
+
+def _cache_lookup(cache: dict[tuple[object, ...], tuple], key: tuple[object, ...]) -> tuple | None:
+    with _PLAN_CACHE_LOCK:
+        cached = cache.pop(key, None)
+        if cached is not None:
+            cache[key] = cached
+        return cached
+
+def _cache_store(cache: dict[tuple[object, ...], tuple], key: tuple[object, ...], value: tuple) -> None:
+    with _PLAN_CACHE_LOCK:
+        if key not in cache and len(cache) >= _PLAN_CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+
 def validate_performance_profile(project: SchemaProject, profile: PerformanceProfile) -> None:
     table_names = {table.table_name for table in project.tables}
     target_tables = profile.target_tables or tuple(table.table_name for table in project.tables)
@@ -48,13 +87,19 @@ def validate_performance_profile(project: SchemaProject, profile: PerformancePro
             )
         )
 
+    # Only overridden child tables can violate an FK minimum here; without overrides there is
+    # nothing to check, so skip building the effective row map entirely.
+    row_overrides = profile.row_overrides
+    if not row_overrides:
+        return
     effective_rows: dict[str, int] = {table.table_name: table.row_count for table in project.tables}
-    effective_rows.update(profile.row_overrides)
+    effective_rows.update(row_overrides)
     for fk in project.foreign_keys:
-        parent_rows = effective_rows.get(fk.parent_table, 0)
-        min_required = parent_rows * fk.min_children
-        child_override = profile.row_overrides.get(fk.child_table)
-        if child_override is not None and child_override < min_required:
+        child_override = row_overrides.get(fk.child_table)
+        if child_override is None:
+            continue
+        min_required = effective_rows.get(fk.parent_table, 0) * fk.min_children
+        if child_override < min_required:
             raise ValueError(
                 _performance_error(
                     f"Row overrides / {fk.child_table}",
@@ -76,6 +121,17 @@ def _topological_table_order(
     project: SchemaProject,
     selected_tables: tuple[str, ...],
 ) -> tuple[tuple[str, ...], dict[str, set[str]]]:
+    # The order only depends on the selection and the FK edges, so repeat planner runs
+    # over the same schema reuse it; callers get fresh parent sets they may mutate.
+    cache_key = (
+        selected_tables,
+        tuple((fk.parent_table, fk.child_table) for fk in project.foreign_keys),
+    )
+    cached = _cache_lookup(_TOPOLOGICAL_ORDER_CACHE, cache_key)
+    if cached is not None:
+        ordered_tables, parent_items = cached
+        return ordered_tables, {name: set(parents) for name, parents in parent_items}
+
     selected_set = set(selected_tables)
     parents_by_child: dict[str, set[str]] = {name: set() for name in selected_tables}
     children_by_parent: dict[str, set[str]] = {name: set() for name in selected_tables}
@@ -92,17 +148,17 @@ def _topological_table_order(
     ready = sorted(name for name, degree in indegree.items() if degree == 0)
     ordered: list[str] = []
 
+    # ``ready`` is a min-heap so the lexicographically smallest ready table is always next.
     while ready:
-        current = ready.pop(0)
+        current = heapq.heappop(ready)
         ordered.append(current)
-        for child in sorted(children_by_parent[current]):
+        for child in children_by_parent[current]:
             indegree[child] -= 1
             if indegree[child] == 0:
-                ready.append(child)
-                ready.sort()
+                heapq.heappush(ready, child)
 
     if len(ordered) != len(selected_tables):
-        unresolved = sorted(name for name in selected_tables if name not in ordered)
+        unresolved = sorted(name for name, degree in indegree.items() if degree > 0)
         unresolved_text = ", ".join(unresolved)
         raise ValueError(
             _performance_error(
@@ -112,10 +168,39 @@ def _topological_table_order(
             )
         )
 
+    _cache_store(
+        _TOPOLOGICAL_ORDER_CACHE,
+        cache_key,
+        (tuple(ordered), tuple((name, frozenset(parents)) for name, parents in parents_by_child.items())),
+    )
     return tuple(ordered), parents_by_child
 
 def build_chunk_plan(project: SchemaProject, profile: PerformanceProfile) -> list[ChunkPlanEntry]:
+    cache_key = _plan_cache_key(project, profile)
+    cached = _cache_lookup(_CHUNK_PLAN_CACHE, cache_key)
+    if cached is not None:
+        return list(cached)
     validate_performance_profile(project, profile)
+    return _build_chunk_plan_core(project, profile, cache_key=cache_key, cache_checked=True)
+
+def _build_chunk_plan_core(
+    project: SchemaProject,
+    profile: PerformanceProfile,
+    *,
+    cache_key: tuple[object, ...] | None = None,
+    cache_checked: bool = False,
+) -> list[ChunkPlanEntry]:
+    """Build the chunk plan for a profile the caller has already validated.
+
+    ``build_chunk_plan`` passes the key it already built and looked up, so a miss costs one key.
+    """
+    if cache_key is None:
+        cache_key = _plan_cache_key(project, profile)
+    if not cache_checked:
+        cached = _cache_lookup(_CHUNK_PLAN_CACHE, cache_key)
+        if cached is not None:
+            return list(cached)
+
     selected_tables = _selected_table_names(project, profile)
     table_map = {table.table_name: table for table in project.tables}
     ordered_tables, parents_by_child = _topological_table_order(project, selected_tables)
@@ -124,7 +209,7 @@ def build_chunk_plan(project: SchemaProject, profile: PerformanceProfile) -> lis
     effective_rows.update(profile.row_overrides)
 
     stage_by_table: dict[str, int] = {}
-    entries: list[ChunkPlanEntry] = []
+    table_layout: list[tuple[str, int, int]] = []
     for table_name in ordered_tables:
         parent_names = parents_by_child.get(table_name, set())
         if parent_names:
@@ -132,24 +217,24 @@ def build_chunk_plan(project: SchemaProject, profile: PerformanceProfile) -> lis
         else:
             stage = 0
         stage_by_table[table_name] = stage
-
         table_rows = int(effective_rows.get(table_name, table_map[table_name].row_count))
-        chunk_size = profile.chunk_size_rows
-        chunk_count = (table_rows + chunk_size - 1) // chunk_size
-        for chunk_offset in range(chunk_count):
-            start_row = (chunk_offset * chunk_size) + 1
-            end_row = min(table_rows, ((chunk_offset + 1) * chunk_size))
-            rows_in_chunk = end_row - start_row + 1
-            entries.append(
-                ChunkPlanEntry(
-                    table_name=table_name,
-                    stage=stage,
-                    chunk_index=chunk_offset + 1,
-                    start_row=start_row,
-                    end_row=end_row,
-                    rows_in_chunk=rows_in_chunk,
-                )
-            )
+        table_layout.append((table_name, stage, table_rows))
+
+    # Size every table's chunks first, then build the whole plan in one comprehension.
+    chunk_size = profile.chunk_size_rows
+    entries = [
+        ChunkPlanEntry(
+            table_name=table_name,
+            stage=stage,
+            chunk_index=chunk_offset + 1,
+            start_row=(chunk_offset * chunk_size) + 1,
+            end_row=min(table_rows, (chunk_offset + 1) * chunk_size),
+            rows_in_chunk=min(table_rows, (chunk_offset + 1) * chunk_size) - (chunk_offset * chunk_size),
+        )
+        for table_name, stage, table_rows in table_layout
+        for chunk_offset in range((table_rows + chunk_size - 1) // chunk_size)
+    ]
+    _cache_store(_CHUNK_PLAN_CACHE, cache_key, tuple(entries))
     return entries
 
 def summarize_chunk_plan(entries: list[ChunkPlanEntry]) -> ChunkPlanSummary:
@@ -176,15 +261,13 @@ def _selected_tables_with_required_parents(
     for fk in project.foreign_keys:
         parent_by_child.setdefault(fk.child_table, set()).add(fk.parent_table)
 
-    changed = True
-    while changed:
-        changed = False
-        current = list(selected)
-        for table_name in current:
-            for parent_name in parent_by_child.get(table_name, set()):
-                if parent_name not in selected:
-                    selected.add(parent_name)
-                    changed = True
+    # Walk FK edges upward once from the selection instead of rescanning it to a fixed point.
+    queue = deque(selected)
+    while queue:
+        for parent_name in parent_by_child.get(queue.popleft(), ()):
+            if parent_name not in selected:
+                selected.add(parent_name)
+                queue.append(parent_name)
 
     ordered, _parents = _topological_table_order(project, tuple(sorted(selected)))
     return ordered
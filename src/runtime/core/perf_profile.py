@@ -5,6 +5,13 @@ from typing import Any
 
 from src.runtime.core.perf_types import FK_CACHE_MODES, OUTPUT_MODES, PerformanceProfile
 
+# Canonical spellings map to the module constants so parsed values share identity with
+# OUTPUT_MODES / FK_CACHE_MODES and exact matches skip strip()/lower().
+_OUTPUT_MODE_BY_TEXT = {mode: mode for mode in OUTPUT_MODES}
+_FK_CACHE_MODE_BY_TEXT = {mode: mode for mode in FK_CACHE_MODES}
+_TRUE_TEXT = frozenset({"1", "true", "yes", "on"})
+_FALSE_TEXT = frozenset({"0", "false", "no", "off"})
+
 def _performance_error(field: str, issue: str, hint: str) -> str:
     return f"Performance Workbench / {field}: {issue}. Fix: {hint}."
 
@@ -27,8 +34,10 @@ def _parse_bounded_int(
     return parsed
 
 def _parse_output_mode(value: Any) -> str:
+    if isinstance(value, str) and value in _OUTPUT_MODE_BY_TEXT:
+        return _OUTPUT_MODE_BY_TEXT[value]
     text = str(value).strip().lower()
-    if text not in OUTPUT_MODES:
+    if text not in _OUTPUT_MODE_BY_TEXT:
         allowed = ", ".join(OUTPUT_MODES)
         raise ValueError(
             _performance_error(
@@ -37,11 +46,13 @@ def _parse_output_mode(value: Any) -> str:
                 f"choose one of: {allowed}",
             )
         )
-    return text
+    return _OUTPUT_MODE_BY_TEXT[text]
 
 def _parse_fk_cache_mode(value: Any) -> str:
+    if isinstance(value, str) and value in _FK_CACHE_MODE_BY_TEXT:
+        return _FK_CACHE_MODE_BY_TEXT[value]
     text = str(value).strip().lower()
-    if text not in FK_CACHE_MODES:
+    if text not in _FK_CACHE_MODE_BY_TEXT:
         allowed = ", ".join(FK_CACHE_MODES)
         raise ValueError(
             _performance_error(
@@ -50,7 +61,7 @@ def _parse_fk_cache_mode(value: Any) -> str:
                 f"choose one of: {allowed}",
             )
         )
-    return text
+    return _FK_CACHE_MODE_BY_TEXT[text]
 
 def _parse_strict_deterministic_chunking(value: Any) -> bool:
     if isinstance(value, bool):
@@ -58,10 +69,14 @@ def _parse_strict_deterministic_chunking(value: Any) -> bool:
     if isinstance(value, int):
         return value != 0
     if isinstance(value, str):
+        if value in _TRUE_TEXT:
+            return True
+        if value in _FALSE_TEXT:
+            return False
         text = value.strip().lower()
-        if text in {"1", "true", "yes", "on"}:
+        if text in _TRUE_TEXT:
             return True
-        if text in {"0", "false", "no", "off"}:
+        if text in _FALSE_TEXT:
             return False
     raise ValueError(
         _performance_error(
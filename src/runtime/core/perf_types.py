@@ -19,7 +19,7 @@ class PerformanceProfile:
     fk_cache_mode: str = FK_CACHE_MODES[0]
     strict_deterministic_chunking: bool = True
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkloadEstimate:
     table_name: str
     estimated_rows: int
@@ -37,7 +37,7 @@ class WorkloadSummary:
     total_seconds: float
     highest_risk: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChunkPlanEntry:
     table_name: str
     stage: int
@@ -53,7 +53,7 @@ class ChunkPlanSummary:
     max_stage: int
     table_count: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeEvent:
     kind: str
     table_name: str | None = None
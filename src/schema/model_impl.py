@@ -18,7 +18,15 @@ SUPPORTED_DTYPES: tuple[str, ...] = (
 SEMANTIC_NUMERIC_TYPES: tuple[str, ...] = ("latitude", "longitude", "money", "percent")
 
 
-@dataclass(frozen=True)
+def _column_params_error(column_name: object, table_name: object | None = None) -> str:
+    location = f"Column '{column_name}'" if table_name is None else f"Table '{table_name}', column '{column_name}'"
+    return (
+        f"{location}: generator params must be a JSON object. "
+        "Fix: set params to an object (for example {\"path\": \"...\"}) or null."
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class ColumnSpec:
     name: str
     dtype: str
@@ -35,8 +43,20 @@ class ColumnSpec:
     params: dict[str, object] | None = None
     depends_on: list[str] | None = None
 
+    def __post_init__(self) -> None:
+        # Type-check params once at construction so validate_project only inspects keys.
+        # Same scope as the old validator checks: params are read by generators and by
+        # dtype 'bytes' (which treats empty params as unset); other columns ignore them.
+        params = self.params
+        if (
+            params is not None
+            and not isinstance(params, dict)
+            and (self.generator is not None or (self.dtype == "bytes" and params))
+        ):
+            raise ValueError(_column_params_error(self.name))
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TableSpec:
     table_name: str
     columns: list[ColumnSpec] = field(default_factory=list)
@@ -62,7 +82,7 @@ class TableSpec:
     correlation_groups: list[dict[str, object]] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignKeySpec:
     # child side
     child_table: str
@@ -81,7 +101,7 @@ class ForeignKeySpec:
     child_count_distribution: dict[str, object] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SchemaProject:
     name: str
     seed: int = 12345
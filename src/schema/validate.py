@@ -10,12 +10,14 @@ from src.schema.validators.timeline import validate_timeline_constraints
 
 
 def validate_project(project) -> None:
-    table_map = validate_core_project_and_table_rules(project)
+    # Sample CSV paths are stat'ed once per run; the memo never outlives this call.
+    seen_sample_paths: dict[str, bool] = {}
+    table_map = validate_core_project_and_table_rules(project, seen_sample_paths=seen_sample_paths)
     validate_foreign_keys(project, table_map=table_map)
     validate_timeline_constraints(project, table_map=table_map)
     validate_data_quality_profiles(project, table_map=table_map)
     validate_locale_identity_bundles(project, table_map=table_map)
-    validate_sample_profile_fits(project, table_map=table_map)
+    validate_sample_profile_fits(project, table_map=table_map, seen_sample_paths=seen_sample_paths)
 
 
 __all__ = ["correlation_cholesky_lower", "validate_project"]
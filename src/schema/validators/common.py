@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import math
+import os
+from pathlib import Path
 
 def _validation_error(location: str, issue: str, hint: str) -> str:
     return f"{location}: {issue}. Fix: {hint}."
 
+def _column_error(table, column, issue: str, hint: str) -> str:
+    """Format a column-scoped validation error; the location is only built when raising."""
+    return _validation_error(f"Table '{table.table_name}', column '{column.name}'", issue, hint)
+
 def _is_scalar_json_value(value: object) -> bool:
     return not isinstance(value, (dict, list))
 
@@ -116,12 +122,28 @@ def _parse_non_negative_finite_float(
         )
     return parsed
 
+def _sample_path_exists(resolved_path: Path, seen_paths: dict[str, bool] | None = None) -> bool:
+    """Stat a sample CSV path once per ``validate_project`` call.
+
+    ``seen_paths`` is built fresh by each validation run, so a file moved or deleted between
+    runs is reported by the next validation rather than during generation.
+    """
+    if seen_paths is None:
+        return resolved_path.exists()
+    key = os.fspath(resolved_path)
+    exists = seen_paths.get(key)
+    if exists is None:
+        exists = seen_paths[key] = resolved_path.exists()
+    return exists
+
 
 __all__ = [
     "_validation_error",
+    "_column_error",
     "_is_scalar_json_value",
     "_scalar_identity",
     "_parse_non_negative_int",
     "_parse_probability",
     "_parse_non_negative_finite_float",
+    "_sample_path_exists",
 ]
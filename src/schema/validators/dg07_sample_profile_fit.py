@@ -4,10 +4,16 @@ from src.project_paths import resolve_repo_path
 from src.schema.types import SchemaProject
 from src.schema.types import TableSpec
 from src.schema.validators.common import _parse_non_negative_int
+from src.schema.validators.common import _sample_path_exists
 from src.schema.validators.common import _validation_error
 
 
-def validate_sample_profile_fits(project: SchemaProject, *, table_map: dict[str, TableSpec]) -> None:
+def validate_sample_profile_fits(
+    project: SchemaProject,
+    *,
+    table_map: dict[str, TableSpec],
+    seen_sample_paths: dict[str, bool] | None = None,
+) -> None:
     sample_profile_fits = project.sample_profile_fits
     if sample_profile_fits is not None:
         if not isinstance(sample_profile_fits, list):
@@ -260,7 +266,7 @@ def validate_sample_profile_fits(project: SchemaProject, *, table_map: dict[str,
                     )
                 sample_path = path_raw.strip()
                 resolved_path = resolve_repo_path(sample_path)
-                if not resolved_path.exists():
+                if not _sample_path_exists(resolved_path, seen_sample_paths):
                     raise ValueError(
                         _validation_error(
                             location,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 
+from src.schema.types import ColumnSpec
 from src.schema.types import SchemaProject
 from src.schema.types import TableSpec
 from src.schema.validators.common import _validation_error
@@ -114,6 +115,8 @@ def _validate_fk_child_count_distribution(
 
 
 def validate_foreign_keys(project: SchemaProject, *, table_map: dict[str, TableSpec]) -> None:
+    # Column maps are built once per table and shared by every FK that touches it.
+    col_maps: dict[str, dict[str, ColumnSpec]] = {}
     for fk in project.foreign_keys:
         if fk.child_table not in table_map:
             raise ValueError(
@@ -126,10 +129,12 @@ def validate_foreign_keys(project: SchemaProject, *, table_map: dict[str, TableS
                 "Fix: use an existing table name for parent_table."
             )
 
-        child_table = table_map[fk.child_table]
-        parent_table = table_map[fk.parent_table]
-        child_cols = {c.name: c for c in child_table.columns}
-        parent_cols = {c.name: c for c in parent_table.columns}
+        child_cols = col_maps.get(fk.child_table)
+        if child_cols is None:
+            child_cols = col_maps[fk.child_table] = {c.name: c for c in table_map[fk.child_table].columns}
+        parent_cols = col_maps.get(fk.parent_table)
+        if parent_cols is None:
+            parent_cols = col_maps[fk.parent_table] = {c.name: c for c in table_map[fk.parent_table].columns}
 
         if fk.child_column not in child_cols:
             raise ValueError(
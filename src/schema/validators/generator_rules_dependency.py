@@ -2,9 +2,21 @@ from __future__ import annotations
 
 from src.derived_expression import compile_derived_expression
 from src.project_paths import resolve_repo_path
+from src.schema.validators.common import _sample_path_exists
 
+# Generators with a branch in validate_dependency_generator_rules; keep in sync with the branches.
+DEPENDENCY_RULE_GENERATORS = frozenset(
+    {"derived_expr", "sample_csv", "if_then", "time_offset", "hierarchical_category"}
+)
 
-def validate_dependency_generator_rules(table, column, *, col_map: dict[str, object]) -> None:
+
+def validate_dependency_generator_rules(
+    table,
+    column,
+    *,
+    col_map: dict[str, object],
+    seen_sample_paths: dict[str, bool] | None = None,
+) -> None:
     if column.generator == "derived_expr":
         if column.dtype == "bytes":
             raise ValueError(
@@ -55,7 +67,7 @@ def validate_dependency_generator_rules(table, column, *, col_map: dict[str, obj
             )
         path = path_value.strip()
         resolved_path = resolve_repo_path(path)
-        if not resolved_path.exists():
+        if not _sample_path_exists(resolved_path, seen_sample_paths):
             raise ValueError(
                 f"Table '{table.table_name}', column '{column.name}': generator 'sample_csv' params.path '{path}' does not exist. "
                 "Fix: provide an existing CSV file path (for example tests/fixtures/city_country_pool.csv)."
@@ -340,4 +352,4 @@ def validate_dependency_generator_rules(table, column, *, col_map: dict[str, obj
                     "Fix: add those choices to params.hierarchy or set params.default_children."
                 )
 
-__all__ = ["validate_dependency_generator_rules"]
+__all__ = ["DEPENDENCY_RULE_GENERATORS", "validate_dependency_generator_rules"]
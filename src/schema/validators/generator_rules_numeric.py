@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+# Generators with a branch in validate_numeric_generator_rules; keep in sync with the branches.
+NUMERIC_RULE_GENERATORS = frozenset(
+    {"uniform_int", "uniform_float", "normal", "lognormal", "choice_weighted", "ordered_choice"}
+)
+
 
 def validate_numeric_generator_rules(
     table,
@@ -367,4 +372,4 @@ def validate_numeric_generator_rules(
                     "Fix: set params.start_index within every configured order length."
                 )
 
-__all__ = ["validate_numeric_generator_rules"]
+__all__ = ["NUMERIC_RULE_GENERATORS", "validate_numeric_generator_rules"]
@@ -5,7 +5,9 @@ from src.schema.validators import scd
 from src.schema.validators.correlation import _validate_correlation_groups_for_table
 from src.schema.validators.generator_param_parsing import _parse_float_param
 from src.schema.validators.generator_param_parsing import _parse_int_param
+from src.schema.validators.generator_rules_dependency import DEPENDENCY_RULE_GENERATORS
 from src.schema.validators.generator_rules_dependency import validate_dependency_generator_rules
+from src.schema.validators.generator_rules_numeric import NUMERIC_RULE_GENERATORS
 from src.schema.validators.generator_rules_numeric import validate_numeric_generator_rules
 from src.schema.validators.project_table_rules import validate_column_structural_rules
 from src.schema.validators.project_table_rules import validate_project_header_and_table_map
@@ -13,9 +15,18 @@ from src.schema.validators.project_table_rules import validate_table_structure
 from src.schema.validators.state_transition import validate_state_transition_generator
 
 
-def validate_core_project_and_table_rules(project: SchemaProject) -> dict[str, object]:
+def validate_core_project_and_table_rules(
+    project: SchemaProject,
+    *,
+    seen_sample_paths: dict[str, bool] | None = None,
+) -> dict[str, object]:
     table_map = validate_project_header_and_table_map(project)
 
+    # Collect each table's incoming FK child columns in one pass over the FKs.
+    incoming_fk_cols_by_table: dict[str, set[str]] = {}
+    for fk in project.foreign_keys:
+        incoming_fk_cols_by_table.setdefault(fk.child_table, set()).add(fk.child_column)
+
     # Per-table validations
     for table in project.tables:
         # # We now allow for auto-sizing of children
@@ -25,17 +36,31 @@ def validate_core_project_and_table_rules(project: SchemaProject) -> dict[str, o
 
         for column in table.columns:
             validate_column_structural_rules(table, column)
-            validate_numeric_generator_rules(
-                table,
-                column,
-                parse_float_param=_parse_float_param,
-                parse_int_param=_parse_int_param,
-            )
-            validate_state_transition_generator(table, column, col_map)
-            validate_dependency_generator_rules(table, column, col_map=col_map)
-
-        incoming = [fk for fk in project.foreign_keys if fk.child_table == table.table_name]
-        incoming_fk_cols = {fk.child_column for fk in incoming}
+            # Each generator has its rules in exactly one validator, so dispatch on the name
+            # instead of walking every validator's branch chain for every column.
+            generator = column.generator
+            if generator is None:
+                continue
+            if generator in NUMERIC_RULE_GENERATORS:
+                validate_numeric_generator_rules(
+                    table,
+                    column,
+                    parse_float_param=_parse_float_param,
+                    parse_int_param=_parse_int_param,
+                )
+            elif generator == "state_transition":
+                validate_state_transition_generator(table, column, col_map)
+            elif generator in DEPENDENCY_RULE_GENERATORS:
+                validate_dependency_generator_rules(
+                    table,
+                    column,
+                    col_map=col_map,
+                    seen_sample_paths=seen_sample_paths,
+                )
+
+        incoming_fk_cols = incoming_fk_cols_by_table.get(table.table_name)
+        if incoming_fk_cols is None:
+            incoming_fk_cols = set()
         _validate_correlation_groups_for_table(
             table,
             col_map=col_map,
@@ -3,8 +3,11 @@ from __future__ import annotations
 from src.schema.types import SEMANTIC_NUMERIC_TYPES
 from src.schema.types import SUPPORTED_DTYPES
 from src.schema.types import SchemaProject
+from src.schema.validators.common import _column_error
 from src.schema.validators.common import _validation_error
 
+_SUPPORTED_DTYPE_SET = frozenset(SUPPORTED_DTYPES)
+
 
 def validate_project_header_and_table_map(project: SchemaProject) -> dict[str, object]:
     if not project.name.strip():
@@ -25,21 +28,27 @@ def validate_project_header_and_table_map(project: SchemaProject) -> dict[str, o
             )
         )
 
-    # Unique table names
-    table_names = [table.table_name.strip() for table in project.tables]
-    if any(name == "" for name in table_names):
-        raise ValueError(
-            _validation_error(
-                "Project tables",
-                "table_name cannot be empty",
-                "set a non-empty table_name for every table",
+    # Unique table names; one pass, with empty names still reported ahead of duplicates.
+    # setdefault returns the earlier index for a repeated name: one hash per table.
+    first_table_index: dict[str, int] = {}
+    duplicate_table_name: str | None = None
+    for index, table in enumerate(project.tables):
+        name = table.table_name.strip()
+        if not name:
+            raise ValueError(
+                _validation_error(
+                    "Project tables",
+                    "table_name cannot be empty",
+                    "set a non-empty table_name for every table",
+                )
             )
-        )
-    if len(set(table_names)) != len(table_names):
+        if first_table_index.setdefault(name, index) != index and duplicate_table_name is None:
+            duplicate_table_name = name
+    if duplicate_table_name is not None:
         raise ValueError(
             _validation_error(
                 "Project tables",
-                "table names must be unique",
+                f"table names must be unique (duplicate '{duplicate_table_name}')",
                 "rename duplicate tables so each table_name is unique",
             )
         )
@@ -58,27 +67,40 @@ def validate_table_structure(table) -> dict[str, object]:
             )
         )
 
-    col_names = [column.name.strip() for column in table.columns]
-    if any(name == "" for name in col_names):
-        raise ValueError(
-            _validation_error(
-                f"Table '{table.table_name}'",
-                "all column names must be non-empty",
-                "set a non-empty name for every column",
+    # One pass collects names, the column map and the primary keys; blank names raise at once
+    # while the other findings are reported afterwards in their established order.
+    first_col_index: dict[str, int] = {}
+    duplicate_col_name: str | None = None
+    col_map: dict[str, object] = {}
+    pk = None
+    pk_count = 0
+    for index, column in enumerate(table.columns):
+        col_map[column.name] = column
+        if column.primary_key:
+            if pk is None:
+                pk = column
+            pk_count += 1
+        name = column.name.strip()
+        if not name:
+            raise ValueError(
+                _validation_error(
+                    f"Table '{table.table_name}'",
+                    "all column names must be non-empty",
+                    "set a non-empty name for every column",
+                )
             )
-        )
-    if len(set(col_names)) != len(col_names):
+        if first_col_index.setdefault(name, index) != index and duplicate_col_name is None:
+            duplicate_col_name = name
+    if duplicate_col_name is not None:
         raise ValueError(
             _validation_error(
                 f"Table '{table.table_name}'",
-                "column names must be unique",
+                f"column names must be unique (duplicate '{duplicate_col_name}')",
                 "rename duplicate columns so each column name is unique",
             )
         )
-    col_map = {column.name: column for column in table.columns}
 
-    pk_cols = [column for column in table.columns if column.primary_key]
-    if len(pk_cols) > 1:
+    if pk_count > 1:
         raise ValueError(
             _validation_error(
                 f"Table '{table.table_name}'",
@@ -86,7 +108,7 @@ def validate_table_structure(table) -> dict[str, object]:
                 "keep exactly one column with primary_key=true",
             )
         )
-    if len(pk_cols) == 0:
+    if pk is None:
         raise ValueError(
             _validation_error(
                 f"Table '{table.table_name}'",
@@ -95,11 +117,11 @@ def validate_table_structure(table) -> dict[str, object]:
             )
         )
 
-    pk = pk_cols[0]
     if pk.dtype != "int":
         raise ValueError(
-            _validation_error(
-                f"Table '{table.table_name}', column '{pk.name}'",
+            _column_error(
+                table,
+                pk,
                 "primary key must be dtype=int in this MVP",
                 "change the PK dtype to 'int'",
             )
@@ -109,88 +131,122 @@ def validate_table_structure(table) -> dict[str, object]:
 
 
 def validate_column_structural_rules(table, column) -> None:
-    if column.dtype not in SUPPORTED_DTYPES:
+    # Called once per column; read each field into a local once.
+    dtype = column.dtype
+    choices = column.choices
+    min_value = column.min_value
+    max_value = column.max_value
+    if dtype not in _SUPPORTED_DTYPE_SET:
         allowed = ", ".join(SUPPORTED_DTYPES)
-        if column.dtype in SEMANTIC_NUMERIC_TYPES:
+        if dtype in SEMANTIC_NUMERIC_TYPES:
             raise ValueError(
-                f"Table '{table.table_name}', column '{column.name}': unsupported dtype '{column.dtype}'. "
-                f"Fix: use dtype='decimal' (or legacy 'float') with generator='{column.dtype}'. "
-                f"Allowed dtypes: {allowed}."
+                _column_error(
+                    table,
+                    column,
+                    f"unsupported dtype '{dtype}'",
+                    f"use dtype='decimal' (or legacy 'float') with generator='{dtype}'. "
+                    f"Allowed dtypes: {allowed}",
+                )
             )
         raise ValueError(
-            f"Table '{table.table_name}', column '{column.name}': unsupported dtype '{column.dtype}'. "
-            f"Fix: use one of: {allowed}."
+            _column_error(
+                table,
+                column,
+                f"unsupported dtype '{dtype}'",
+                f"use one of: {allowed}",
+            )
         )
-    if column.choices is not None and len(column.choices) == 0:
+    if choices is not None and len(choices) == 0:
         raise ValueError(
-            _validation_error(
-                f"Table '{table.table_name}', column '{column.name}'",
+            _column_error(
+                table,
+                column,
                 "choices cannot be empty",
                 "provide one or more choices or omit choices",
             )
         )
-    if (column.min_value is not None) and (column.max_value is not None) and (column.min_value > column.max_value):
+    if (min_value is not None) and (max_value is not None) and (min_value > max_value):
         raise ValueError(
-            _validation_error(
-                f"Table '{table.table_name}', column '{column.name}'",
+            _column_error(
+                table,
+                column,
                 "min_value cannot exceed max_value",
                 "set min_value <= max_value",
             )
         )
-    if column.dtype == "bytes":
-        if column.min_value is not None or column.max_value is not None:
+    if dtype == "bytes":
+        if min_value is not None or max_value is not None:
             raise ValueError(
-                f"Table '{table.table_name}', column '{column.name}': dtype 'bytes' does not support min_value/max_value. "
-                "Fix: remove numeric bounds and use params.min_length/params.max_length for bytes length."
+                _column_error(
+                    table,
+                    column,
+                    "dtype 'bytes' does not support min_value/max_value",
+                    "remove numeric bounds and use params.min_length/params.max_length for bytes length",
+                )
             )
-        if column.choices is not None:
+        if choices is not None:
             raise ValueError(
-                f"Table '{table.table_name}', column '{column.name}': dtype 'bytes' does not support choices. "
-                "Fix: remove choices or use a bytes-compatible generator."
+                _column_error(
+                    table,
+                    column,
+                    "dtype 'bytes' does not support choices",
+                    "remove choices or use a bytes-compatible generator",
+                )
             )
         if column.pattern is not None:
             raise ValueError(
-                f"Table '{table.table_name}', column '{column.name}': dtype 'bytes' does not support regex pattern. "
-                "Fix: remove pattern or change dtype to 'text' for regex validation."
+                _column_error(
+                    table,
+                    column,
+                    "dtype 'bytes' does not support regex pattern",
+                    "remove pattern or change dtype to 'text' for regex validation",
+                )
             )
 
+        # ColumnSpec rejects non-dict params at construction.
         params = column.params or {}
-        if not isinstance(params, dict):
-            raise ValueError(
-                f"Table '{table.table_name}', column '{column.name}': dtype 'bytes' params must be a JSON object when provided. "
-                "Fix: set params to an object like {\"min_length\": 8, \"max_length\": 16} or null."
-            )
         min_len_raw = params.get("min_length", 8)
         max_len_raw = params.get("max_length", min_len_raw)
         try:
             min_len = int(min_len_raw)
         except (TypeError, ValueError) as exc:
             raise ValueError(
-                f"Table '{table.table_name}', column '{column.name}': dtype 'bytes' params.min_length must be an integer. "
-                "Fix: set params.min_length to a whole number of bytes."
+                _column_error(
+                    table,
+                    column,
+                    "dtype 'bytes' params.min_length must be an integer",
+                    "set params.min_length to a whole number of bytes",
+                )
             ) from exc
         try:
             max_len = int(max_len_raw)
         except (TypeError, ValueError) as exc:
             raise ValueError(
-                f"Table '{table.table_name}', column '{column.name}': dtype 'bytes' params.max_length must be an integer. "
-                "Fix: set params.max_length to a whole number of bytes."
+                _column_error(
+                    table,
+                    column,
+                    "dtype 'bytes' params.max_length must be an integer",
+                    "set params.max_length to a whole number of bytes",
+                )
             ) from exc
         if min_len < 0 or max_len < 0:
             raise ValueError(
-                f"Table '{table.table_name}', column '{column.name}': dtype 'bytes' length bounds must be non-negative. "
-                "Fix: set params.min_length and params.max_length to 0 or greater."
+                _column_error(
+                    table,
+                    column,
+                    "dtype 'bytes' length bounds must be non-negative",
+                    "set params.min_length and params.max_length to 0 or greater",
+                )
             )
         if min_len > max_len:
             raise ValueError(
-                f"Table '{table.table_name}', column '{column.name}': dtype 'bytes' min_length cannot exceed max_length. "
-                "Fix: set params.min_length <= params.max_length."
+                _column_error(
+                    table,
+                    column,
+                    "dtype 'bytes' min_length cannot exceed max_length",
+                    "set params.min_length <= params.max_length",
+                )
             )
-    if column.generator is not None and column.params is not None and not isinstance(column.params, dict):
-        raise ValueError(
-            f"Table '{table.table_name}', column '{column.name}': generator params must be a JSON object. "
-            "Fix: set params to an object (for example {\"path\": \"...\"}) or null."
-        )
 
 
 __all__ = [
@@ -10,6 +10,20 @@ def validate_table_scd_and_business_key(
     col_map: dict[str, ColumnSpec],
     incoming_fk_cols: set[str],
 ) -> None:
+    # Most tables carry no business-key or SCD configuration; every check below is gated
+    # on one of these fields, so such tables are done after the presence checks.
+    if (
+        t.business_key is None
+        and t.business_key_unique_count is None
+        and t.business_key_static_columns is None
+        and t.business_key_changing_columns is None
+        and t.scd_mode is None
+        and t.scd_tracked_columns is None
+        and t.scd_active_from_column is None
+        and t.scd_active_to_column is None
+    ):
+        return
+
     business_key = t.business_key
     business_key_unique_count = t.business_key_unique_count
     if business_key_unique_count is not None:
@@ -114,22 +128,23 @@ def validate_table_scd_and_business_key(
                 "Fix: put each column in only one business-key behavior list."
             )
 
-    scd_mode_raw = t.scd_mode.strip().lower() if isinstance(t.scd_mode, str) else ""
-    scd_mode = scd_mode_raw or None
-    if scd_mode not in {None, "scd1", "scd2"}:
-        raise ValueError(
-            f"Table '{t.table_name}': unsupported scd_mode '{t.scd_mode}'. "
-            "Fix: use scd_mode='scd1' or scd_mode='scd2', or omit scd_mode."
-        )
+    # Most tables have no SCD mode, so only string modes pay for normalization; other
+    # non-string values keep being treated as unset.
+    scd_mode = None
+    if t.scd_mode is not None and isinstance(t.scd_mode, str):
+        scd_mode = t.scd_mode.strip().lower() or None
+        if scd_mode not in {None, "scd1", "scd2"}:
+            raise ValueError(
+                f"Table '{t.table_name}': unsupported scd_mode '{t.scd_mode}'. "
+                "Fix: use scd_mode='scd1' or scd_mode='scd2', or omit scd_mode."
+            )
 
-    has_scd_fields = any(
-        [
-            t.scd_tracked_columns is not None,
-            t.scd_active_from_column is not None,
-            t.scd_active_to_column is not None,
-            t.business_key_static_columns is not None,
-            t.business_key_changing_columns is not None,
-        ]
+    has_scd_fields = (
+        t.scd_tracked_columns is not None
+        or t.scd_active_from_column is not None
+        or t.scd_active_to_column is not None
+        or t.business_key_static_columns is not None
+        or t.business_key_changing_columns is not None
     )
     if scd_mode is None and has_scd_fields:
         raise ValueError(
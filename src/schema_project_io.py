@@ -1,8 +1,13 @@
+import copy
 import json
-from dataclasses import asdict
+from sys import intern
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from pathlib import Path
 
 from src.schema_project_model import SchemaProject, TableSpec, ColumnSpec, ForeignKeySpec, validate_project
-from src.project_paths import to_repo_relative_path
+from src.schema.model_impl import _column_params_error
+from src.project_paths import repo_root, to_repo_relative_path
 
 
 _DEFAULT_SQL_TYPES: dict[str, str] = {
@@ -15,77 +20,158 @@ _DEFAULT_SQL_TYPES: dict[str, str] = {
     "datetime": "TIMESTAMP",
     "bytes": "BLOB",
 }
+_ALLOWED_SQL_DTYPES_TEXT = ", ".join(sorted(_DEFAULT_SQL_TYPES))
+
+_SAMPLE_PATH_PLACEHOLDERS: dict[str, str] = {
+    "__CITY_COUNTRY_CSV__": "tests/fixtures/city_country_pool.csv",
+}
+
+
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+_DATACLASS_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
 
 
+def _to_json_tree(value: object) -> object:
+    """Project model dataclasses into fresh dicts/lists, like ``asdict`` without its deepcopy pass."""
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return value
+    if isinstance(value, dict):
+        return {key: _to_json_tree(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return value_type(_to_json_tree(item) for item in value)
+    field_names = _DATACLASS_FIELD_NAMES.get(value_type)
+    if field_names is None:
+        if not is_dataclass(value):
+            return copy.deepcopy(value)
+        field_names = tuple(f.name for f in fields(value))
+        _DATACLASS_FIELD_NAMES[value_type] = field_names
+    return {name: _to_json_tree(getattr(value, name)) for name in field_names}
+
+
+@lru_cache(maxsize=1024)
 def _quote_identifier(name: str) -> str:
+    if '"' not in name:
+        return f'"{name}"'
     return '"' + name.replace('"', '""') + '"'
 
 
-def _default_sql_type(dtype: str, *, table_name: str, column_name: str) -> str:
+def _default_sql_type(dtype: str, table_name: str, column_name: str) -> str:
     sql_type = _DEFAULT_SQL_TYPES.get(dtype)
     if sql_type is not None:
         return sql_type
-    allowed = ", ".join(sorted(_DEFAULT_SQL_TYPES.keys()))
     raise ValueError(
         "SQL DDL generation failed at "
         f"table '{table_name}', column '{column_name}': unsupported dtype '{dtype}'. "
-        f"Fix: use one of: {allowed}."
+        f"Fix: use one of: {_ALLOWED_SQL_DTYPES_TEXT}."
     )
 
 
 def build_project_sql_ddl(project: SchemaProject) -> str:
     validate_project(project)
+    return _build_project_sql_ddl(project)
 
-    fks_by_child_table: dict[str, list[ForeignKeySpec]] = {}
+
+def _build_project_sql_ddl(project: SchemaProject) -> str:
+    """Render DDL for a project the caller has already validated."""
+    # Validation guarantees every FK child table exists, so the buckets can be allocated up front.
+    fks_by_child_table: dict[str, list[ForeignKeySpec]] = {table.table_name: [] for table in project.tables}
     for fk in project.foreign_keys:
-        fks_by_child_table.setdefault(fk.child_table, []).append(fk)
+        fks_by_child_table[fk.child_table].append(fk)
 
-    statements: list[str] = []
-    for table in project.tables:
-        lines: list[str] = []
+    # Emit every token into one list and join once instead of building per-line temporaries.
+    parts: list[str] = []
+    sql_type_for = _DEFAULT_SQL_TYPES.get
+    for table_index, table in enumerate(project.tables):
+        if table_index:
+            parts.append("\n\n")
+        parts.append("CREATE TABLE ")
+        parts.append(_quote_identifier(table.table_name))
+        parts.append(" (\n  ")
+        separator = ""
         for column in table.columns:
-            col_parts = [
-                _quote_identifier(column.name),
-                _default_sql_type(column.dtype, table_name=table.table_name, column_name=column.name),
-            ]
+            parts.append(separator)
+            separator = ",\n  "
+            parts.append(_quote_identifier(column.name))
+            parts.append(" ")
+            parts.append(
+                sql_type_for(column.dtype) or _default_sql_type(column.dtype, table.table_name, column.name)
+            )
             if not column.nullable:
-                col_parts.append("NOT NULL")
+                parts.append(" NOT NULL")
             if column.primary_key:
-                col_parts.append("PRIMARY KEY")
+                parts.append(" PRIMARY KEY")
             if column.unique:
-                col_parts.append("UNIQUE")
-            lines.append("  " + " ".join(col_parts))
-
-        for fk in fks_by_child_table.get(table.table_name, []):
-            lines.append(
-                "  "
-                + "FOREIGN KEY "
-                + f"({_quote_identifier(fk.child_column)}) "
-                + "REFERENCES "
-                + f"{_quote_identifier(fk.parent_table)} "
-                + f"({_quote_identifier(fk.parent_column)})"
-            )
+                parts.append(" UNIQUE")
 
-        statement = f"CREATE TABLE {_quote_identifier(table.table_name)} (\n"
-        statement += ",\n".join(lines)
-        statement += "\n);"
-        statements.append(statement)
+        for fk in fks_by_child_table[table.table_name]:
+            parts.append(separator)
+            separator = ",\n  "
+            parts.append("FOREIGN KEY (")
+            parts.append(_quote_identifier(fk.child_column))
+            parts.append(") REFERENCES ")
+            parts.append(_quote_identifier(fk.parent_table))
+            parts.append(" (")
+            parts.append(_quote_identifier(fk.parent_column))
+            parts.append(")")
+        parts.append("\n);")
 
-    return "\n\n".join(statements)
+    return "".join(parts)
 
 
 def save_project_to_json(project: SchemaProject, path: str) -> None:
     validate_project(project)
-    data = asdict(project)
+    data = _to_json_tree(project)
     _normalize_sample_csv_paths(data)
-    data["sql_ddl"] = build_project_sql_ddl(project)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    data["sql_ddl"] = _build_project_sql_ddl(project)
+    # Encode in one call and write the bytes once; json.dump with indent issues a write per
+    # token and text mode would re-encode the whole document on its way out.
+    payload = json.dumps(data, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
+
+
+def _check_project_document_shape(data: object) -> None:
+    """Reject structurally malformed project JSON before any model objects are built.
+
+    Only container shapes are checked here; field-level rules stay in ``validate_project``.
+    """
+    if type(data) is not dict:
+        raise ValueError(
+            "Schema project JSON must be an object. "
+            "Fix: save the schema project as a JSON object with name, tables, and foreign_keys."
+        )
+    tables = data.get("tables")
+    if type(tables) is not list:
+        raise ValueError(
+            "Project: tables must be a list. "
+            "Fix: set tables to a list of table objects."
+        )
+    for idx, table in enumerate(tables):
+        if type(table) is not dict:
+            raise ValueError(
+                f"Project, tables[{idx}]: table must be an object. "
+                "Fix: provide each table as a JSON object."
+            )
+        columns = table.get("columns")
+        if type(columns) is not list or any(type(column) is not dict for column in columns):
+            raise ValueError(
+                f"Table '{table.get('table_name', '<unknown>')}': columns must be a list of objects. "
+                "Fix: provide columns as a list of column objects."
+            )
+    foreign_keys = data.get("foreign_keys", [])
+    if type(foreign_keys) is not list or any(type(fk) is not dict for fk in foreign_keys):
+        raise ValueError(
+            "Project: foreign_keys must be a list of objects when provided. "
+            "Fix: provide foreign_keys as a list of FK objects or omit it."
+        )
 
 
 def load_project_from_json(path: str) -> SchemaProject:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = json.loads(f.read())
+
+    _check_project_document_shape(data)
 
     sql_ddl = data.get("sql_ddl")
     if (sql_ddl is not None) and (not isinstance(sql_ddl, str)):
@@ -96,6 +182,8 @@ def load_project_from_json(path: str) -> SchemaProject:
 
     _normalize_sample_csv_paths(data)
 
+    # ``data`` was just decoded and is not shared, so validated rule/profile lists are handed
+    # to the model as-is instead of being copied item by item.
     raw_timeline_constraints = data.get("timeline_constraints")
     timeline_constraints: list[dict[str, object]] | None = None
     if raw_timeline_constraints is not None:
@@ -104,14 +192,13 @@ def load_project_from_json(path: str) -> SchemaProject:
                 "Project: timeline_constraints must be a list when provided. "
                 "Fix: set timeline_constraints to a list of rule objects or omit it."
             )
-        timeline_constraints = []
         for idx, raw_rule in enumerate(raw_timeline_constraints):
             if not isinstance(raw_rule, dict):
                 raise ValueError(
                     f"Project, timeline_constraints[{idx}]: rule must be an object. "
                     "Fix: provide each timeline constraint rule as a JSON object."
                 )
-            timeline_constraints.append(dict(raw_rule))
+        timeline_constraints = raw_timeline_constraints
 
     raw_data_quality_profiles = data.get("data_quality_profiles")
     data_quality_profiles: list[dict[str, object]] | None = None
@@ -121,14 +208,13 @@ def load_project_from_json(path: str) -> SchemaProject:
                 "Project: data_quality_profiles must be a list when provided. "
                 "Fix: set data_quality_profiles to a list of profile objects or omit it."
             )
-        data_quality_profiles = []
         for idx, raw_profile in enumerate(raw_data_quality_profiles):
             if not isinstance(raw_profile, dict):
                 raise ValueError(
                     f"Project, data_quality_profiles[{idx}]: profile must be an object. "
                     "Fix: provide each DG06 profile as a JSON object."
                 )
-            data_quality_profiles.append(dict(raw_profile))
+        data_quality_profiles = raw_data_quality_profiles
 
     raw_sample_profile_fits = data.get("sample_profile_fits")
     sample_profile_fits: list[dict[str, object]] | None = None
@@ -138,14 +224,13 @@ def load_project_from_json(path: str) -> SchemaProject:
                 "Project: sample_profile_fits must be a list when provided. "
                 "Fix: set sample_profile_fits to a list of fit objects or omit it."
             )
-        sample_profile_fits = []
         for idx, raw_fit in enumerate(raw_sample_profile_fits):
             if not isinstance(raw_fit, dict):
                 raise ValueError(
                     f"Project, sample_profile_fits[{idx}]: fit must be an object. "
                     "Fix: provide each DG07 fit as a JSON object."
                 )
-            sample_profile_fits.append(dict(raw_fit))
+        sample_profile_fits = raw_sample_profile_fits
 
     raw_locale_identity_bundles = data.get("locale_identity_bundles")
     locale_identity_bundles: list[dict[str, object]] | None = None
@@ -155,14 +240,13 @@ def load_project_from_json(path: str) -> SchemaProject:
                 "Project: locale_identity_bundles must be a list when provided. "
                 "Fix: set locale_identity_bundles to a list of DG09 bundle objects or omit it."
             )
-        locale_identity_bundles = []
         for idx, raw_bundle in enumerate(raw_locale_identity_bundles):
             if not isinstance(raw_bundle, dict):
                 raise ValueError(
                     f"Project, locale_identity_bundles[{idx}]: bundle must be an object. "
                     "Fix: provide each DG09 bundle as a JSON object."
                 )
-            locale_identity_bundles.append(dict(raw_bundle))
+        locale_identity_bundles = raw_locale_identity_bundles
 
     tables = []
     for t in data["tables"]:
@@ -189,15 +273,27 @@ def load_project_from_json(path: str) -> SchemaProject:
                     f"Table '{t.get('table_name', '<unknown>')}': correlation_groups must be a list when provided. "
                     "Fix: set correlation_groups to a list of objects or omit it."
                 )
-            correlation_groups = []
             for idx, raw_group in enumerate(raw_correlation_groups):
                 if not isinstance(raw_group, dict):
                     raise ValueError(
                         f"Table '{t.get('table_name', '<unknown>')}', correlation_groups[{idx}]: group must be an object. "
                         "Fix: provide each correlation group as a JSON object."
                     )
-                correlation_groups.append(dict(raw_group))
-        cols = [ColumnSpec(**c) for c in t["columns"]]
+            correlation_groups = raw_correlation_groups
+        cols = []
+        for c in t["columns"]:
+            # Share one string object per distinct dtype/generator across the whole project.
+            dtype = c.get("dtype")
+            if type(dtype) is str:
+                c["dtype"] = intern(dtype)
+            generator = c.get("generator")
+            if type(generator) is str:
+                c["generator"] = intern(generator)
+            try:
+                cols.append(ColumnSpec(**c))
+            except ValueError as exc:
+                # ColumnSpec only knows its own name; report the table too, like validate_project.
+                raise ValueError(_column_params_error(c.get("name"), t.get("table_name", "<unknown>"))) from exc
         tables.append(
             TableSpec(
                 table_name=t["table_name"],
@@ -231,42 +327,60 @@ def load_project_from_json(path: str) -> SchemaProject:
     return project
 
 
-def _normalize_sample_csv_paths(data: dict[str, object]) -> None:
-    for table in data.get("tables", []):
-        if not isinstance(table, dict):
-            continue
-        for column in table.get("columns", []):
-            if not isinstance(column, dict):
-                continue
-            if column.get("generator") != "sample_csv":
-                continue
-            params = column.get("params")
-            if not isinstance(params, dict):
-                continue
-            path_value = params.get("path")
-            if not isinstance(path_value, str) or path_value.strip() == "":
-                continue
-
-            raw_path = path_value.strip()
-            if raw_path == "__CITY_COUNTRY_CSV__":
-                params["path"] = "tests/fixtures/city_country_pool.csv"
-                continue
-            params["path"] = to_repo_relative_path(raw_path)
+def _normalized_sample_path(
+    path_value: object,
+    root: Path,
+    resolved_paths: dict[str, str | None],
+) -> str | None:
+    """Return the repo-relative form of a sample path, or None to leave the value untouched."""
+    if type(path_value) is not str:
+        return None
+    # Many columns usually share one sample CSV; resolve (and stat) each distinct path once.
+    if path_value in resolved_paths:
+        return resolved_paths[path_value]
+    normalized = _normalize_sample_path_text(path_value, root)
+    resolved_paths[path_value] = normalized
+    return normalized
+
+
+def _normalize_sample_path_text(path_value: str, root: Path) -> str | None:
+    raw_path = path_value
+    if raw_path[:1].isspace() or raw_path[-1:].isspace():
+        raw_path = raw_path.strip()
+    if not raw_path:
+        return None
+    placeholder_target = _SAMPLE_PATH_PLACEHOLDERS.get(raw_path)
+    if placeholder_target is not None:
+        return placeholder_target
+    return to_repo_relative_path(raw_path, root=root)
+
 
+def _normalize_sample_csv_paths(data: dict[str, object]) -> None:
+    # ``data`` always comes from json.loads or _to_json_tree, so containers are plain dicts
+    # and lists and exact type checks are enough. Collect every dict holding a sample
+    # ``path`` first, then rewrite them in one flat loop.
+    targets = [
+        params
+        for table in data.get("tables", ())
+        if type(table) is dict
+        for column in table.get("columns", ())
+        if type(column) is dict
+        and column.get("generator") == "sample_csv"
+        and type(params := column.get("params")) is dict
+    ]
     sample_profile_fits = data.get("sample_profile_fits")
-    if not isinstance(sample_profile_fits, list):
+    if type(sample_profile_fits) is list:
+        targets.extend(
+            source
+            for fit in sample_profile_fits
+            if type(fit) is dict and type(source := fit.get("sample_source")) is dict
+        )
+    if not targets:
         return
-    for fit in sample_profile_fits:
-        if not isinstance(fit, dict):
-            continue
-        source = fit.get("sample_source")
-        if not isinstance(source, dict):
-            continue
-        path_value = source.get("path")
-        if not isinstance(path_value, str) or path_value.strip() == "":
-            continue
-        raw_path = path_value.strip()
-        if raw_path == "__CITY_COUNTRY_CSV__":
-            source["path"] = "tests/fixtures/city_country_pool.csv"
-            continue
-        source["path"] = to_repo_relative_path(raw_path)
+
+    root = repo_root()
+    resolved_paths: dict[str, str | None] = {}
+    for target in targets:
+        normalized = _normalized_sample_path(target.get("path"), root, resolved_paths)
+        if normalized is not None:
+            target["path"] = normalized
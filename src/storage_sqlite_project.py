@@ -1,5 +1,6 @@
 import logging
 import sqlite3
+from itertools import islice
 from typing import Iterable
 
 from src.schema_project_model import SchemaProject, TableSpec, ColumnSpec, ForeignKeySpec, validate_project
@@ -27,6 +28,21 @@ def _connect(db_path: str) -> sqlite3.Connection:
     return conn
 
 
+def _configure_sqlite_for_bulk(conn: sqlite3.Connection) -> str:
+    """Per-connection settings for bulk ingest: the insert runs in one transaction, so
+    NORMAL sync is still crash-safe under WAL and a larger page cache avoids spills.
+
+    Journal mode is persistent in the database file, so the previous mode is returned for
+    the caller to restore once the insert is done.
+    """
+    previous_journal_mode = conn.execute("PRAGMA journal_mode;").fetchone()[0]
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -65536;")
+    return previous_journal_mode
+
+
 def create_tables(db_path: str, project: SchemaProject) -> None:
     validate_project(project)
 
@@ -88,35 +104,41 @@ def insert_project_rows(
 
     conn = _connect(db_path)
     try:
-        conn.execute("BEGIN;")
-
-        for table_name in order:
-            t = table_map[table_name]
-            rows = rows_by_table.get(table_name, [])
-            if not rows:
-                inserted_counts[table_name] = 0
-                continue
-
-            cols = [c.name for c in t.columns]
-            placeholders = ", ".join(["?"] * len(cols))
-            sql = f"INSERT INTO {table_name} ({', '.join(cols)}) VALUES ({placeholders});"
-
-            total = 0
-            batch: list[list[object]] = []
-
-            for r in rows:
-                batch.append([r.get(c) for c in cols])
-                if len(batch) >= chunk_size:
+        previous_journal_mode = _configure_sqlite_for_bulk(conn)
+        try:
+            conn.execute("BEGIN;")
+
+            for table_name in order:
+                t = table_map[table_name]
+                rows = rows_by_table.get(table_name, [])
+                if not rows:
+                    inserted_counts[table_name] = 0
+                    continue
+
+                cols = [c.name for c in t.columns]
+                placeholders = ", ".join(["?"] * len(cols))
+                sql = f"INSERT INTO {table_name} ({', '.join(cols)}) VALUES ({placeholders});"
+
+                total = 0
+                batch_size = max(1, chunk_size)
+                row_iter = iter(rows)
+                while True:
+                    batch = [tuple(map(r.get, cols)) for r in islice(row_iter, batch_size)]
+                    if not batch:
+                        break
                     conn.executemany(sql, batch)
                     total += len(batch)
-                    batch = []
-            if batch:
-                conn.executemany(sql, batch)
-                total += len(batch)
 
-            inserted_counts[table_name] = total
+                inserted_counts[table_name] = total
 
-        conn.commit()
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            # Leaving WAL checkpoints and removes the -wal/-shm files, so the output database
+            # keeps its original journal mode for readers on shares or read-only copies.
+            conn.execute(f"PRAGMA journal_mode = {previous_journal_mode};")
     finally:
         conn.close()
 
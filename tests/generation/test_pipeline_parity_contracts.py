@@ -5,7 +5,7 @@ import tempfile
 import unittest
 from datetime import date
 
-from src.generator_project import generate_project_rows, generate_project_rows_streaming
+from src.generator_project import dependency_order, generate_project_rows, generate_project_rows_streaming
 from src.schema_project_model import ColumnSpec, ForeignKeySpec, SchemaProject, TableSpec, validate_project
 
 
@@ -346,6 +346,34 @@ class PipelineParityContracts(unittest.TestCase):
                 self.assertLess(prev_to, next_from)
             self.assertEqual(str(ordered[-1]["valid_to"]), "9999-12-31")
 
+    def test_dependency_order_always_takes_smallest_ready_table(self) -> None:
+        def table(name: str) -> TableSpec:
+            return TableSpec(
+                table_name=name,
+                row_count=1,
+                columns=[
+                    ColumnSpec(f"{name}_id", "int", nullable=False, primary_key=True),
+                    ColumnSpec("parent_id", "int", nullable=False),
+                ],
+            )
+
+        names = ("z_root", "a_root", "m_child", "b_child", "c_grandchild")
+        project = SchemaProject(
+            name="dependency_order",
+            seed=1,
+            tables=[table(name) for name in names],
+            foreign_keys=[
+                ForeignKeySpec("m_child", "parent_id", "z_root", "z_root_id", 1, 1),
+                ForeignKeySpec("b_child", "parent_id", "z_root", "z_root_id", 1, 1),
+                ForeignKeySpec("c_grandchild", "parent_id", "a_root", "a_root_id", 1, 1),
+                ForeignKeySpec("c_grandchild", "parent_id", "b_child", "b_child_id", 1, 1),
+            ],
+        )
+        self.assertEqual(
+            dependency_order(project),
+            ["a_root", "z_root", "b_child", "c_grandchild", "m_child"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
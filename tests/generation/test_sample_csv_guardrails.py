@@ -1,4 +1,6 @@
+import os
 import random
+import tempfile
 import unittest
 
 from src.generator_project import generate_project_rows
@@ -72,6 +74,39 @@ class TestSampleCsvGuardrails(unittest.TestCase):
         self.assertEqual(len(rows), 3)
         self.assertTrue(all(isinstance(r["city"], str) and r["city"] for r in rows))
 
+    def test_sample_csv_path_existence_is_rechecked_on_each_validation(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, "cities.csv")
+            project = SchemaProject(
+                name="late_sample_csv",
+                seed=3,
+                tables=[
+                    TableSpec(
+                        table_name="people",
+                        row_count=2,
+                        columns=[
+                            ColumnSpec("id", "int", nullable=False, primary_key=True),
+                            ColumnSpec("city", "text", nullable=False, generator="sample_csv", params={"path": csv_path}),
+                        ],
+                    )
+                ],
+                foreign_keys=[],
+            )
+
+            with self.assertRaises(ValueError) as ctx:
+                validate_project(project)
+            self.assertIn("does not exist", str(ctx.exception))
+
+            with open(csv_path, "w", encoding="utf-8") as handle:
+                handle.write("Paris\nOslo\n")
+            validate_project(project)
+            validate_project(project)
+
+            os.remove(csv_path)
+            with self.assertRaises(ValueError) as ctx:
+                validate_project(project)
+            self.assertIn("does not exist", str(ctx.exception))
+
     def test_validate_project_rejects_dependent_sample_csv_without_depends_on(self):
         project = SchemaProject(
             name="dependent_sample_csv_missing_depends_on",
@@ -1,19 +1,42 @@
+import json
 import os
+import random
+import threading
 import unittest
+import zlib
+from dataclasses import replace
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest import mock
 
 from src.multiprocessing_runtime import (
+    ROUND_ROBIN_ASSIGNMENT_ENV_VAR,
+    MultiprocessConfig,
+    MultiprocessEvent,
     MultiprocessRunCancelled,
+    available_cpu_count,
     build_multiprocess_config,
     build_partition_plan,
     create_run_ledger,
     load_run_ledger,
+    multiprocess_config_from_payload,
+    multiprocess_config_to_payload,
     run_generation_with_multiprocessing,
     save_run_ledger,
     validate_run_ledger,
+    _PartitionTask,
+    _persist_ledger_if_needed,
+    _run_partition_task,
 )
 from src.performance_scaling import build_performance_profile
+from src.runtime.core.mp_events import _EventBuffer, _ProgressThrottle
+from src.runtime.core.mp_execution import (
+    _adaptive_inflight_cap,
+    _claim_worker_slot,
+    _partition_batch_size,
+    _run_partition_batch,
+)
+from src.runtime.core.mp_ledger import _LedgerCommitCoordinator, _append_ledger_journal
 from src.schema_project_model import ColumnSpec, ForeignKeySpec, SchemaProject, TableSpec
 
 
@@ -53,13 +76,13 @@ class TestMultiprocessingRuntime(unittest.TestCase):
             ],
         )
 
-    def _profile(self):
+    def _profile(self, chunk_size_rows: str = "5"):
         return build_performance_profile(
             target_tables_value="customers,orders",
             row_overrides_json_value="",
             preview_row_target_value="500",
             output_mode_value="preview",
-            chunk_size_rows_value="5",
+            chunk_size_rows_value=chunk_size_rows,
             preview_page_size_value="500",
             sqlite_batch_size_value="4000",
             csv_buffer_rows_value="4000",
@@ -68,7 +91,7 @@ class TestMultiprocessingRuntime(unittest.TestCase):
         )
 
     def _multi_config(self):
-        cpu_count = max(1, int(os.cpu_count() or 1))
+        cpu_count = available_cpu_count()
         workers = min(2, cpu_count)
         return build_multiprocess_config(
             mode_value="multi_process_local",
@@ -84,6 +107,9 @@ class TestMultiprocessingRuntime(unittest.TestCase):
         self.assertGreaterEqual(config.worker_count, 1)
         self.assertGreaterEqual(config.max_inflight_chunks, config.worker_count)
         self.assertGreaterEqual(config.ipc_queue_size, config.max_inflight_chunks)
+        payload = multiprocess_config_to_payload(config)
+        self.assertEqual(payload["available_cpus"], available_cpu_count())
+        self.assertEqual(multiprocess_config_from_payload(payload), config)
 
     def test_build_multiprocess_config_errors_are_actionable(self):
         with self.assertRaises(ValueError) as ctx:
@@ -107,6 +133,69 @@ class TestMultiprocessingRuntime(unittest.TestCase):
         self.assertEqual(first[0].stage, 0)
         self.assertEqual(first[-1].table_name, "orders")
         self.assertTrue(all(entry.assigned_worker >= 1 for entry in first))
+        chunk_indexes: dict[str, list[int]] = {}
+        for entry in first:
+            chunk_indexes.setdefault(entry.table_name, []).append(entry.chunk_index)
+        for indexes in chunk_indexes.values():
+            self.assertEqual(indexes, sorted(indexes))
+
+    def test_build_partition_plan_assigns_contiguous_table_blocks(self):
+        with mock.patch("src.runtime.core.mp_config.available_cpu_count", return_value=4):
+            config = build_multiprocess_config(
+                mode_value="multi_process_local",
+                worker_count_value="2",
+                max_inflight_chunks_value="2",
+                ipc_queue_size_value="64",
+                retry_limit_value="1",
+            )
+            plan = build_partition_plan(self._project(), self._profile(), config)
+            with mock.patch.dict(os.environ, {ROUND_ROBIN_ASSIGNMENT_ENV_VAR: "1"}):
+                round_robin = build_partition_plan(self._project(), self._profile(), config)
+            # Single-chunk tables in one stage are spread across workers, not stacked on worker 1.
+            small_tables = SchemaProject(
+                name="small_tables",
+                seed=3,
+                tables=[
+                    TableSpec(f"t{idx}", [ColumnSpec("id", "int", nullable=False, primary_key=True)], row_count=1)
+                    for idx in range(4)
+                ],
+                foreign_keys=[],
+            )
+            small_plan = build_partition_plan(small_tables, replace(self._profile(), target_tables=()), config)
+        orders = [entry.assigned_worker for entry in plan if entry.table_name == "orders"]
+        self.assertEqual(orders, [1, 1, 2, 2])
+        self.assertEqual([entry.assigned_worker for entry in round_robin], [1, 2, 1, 2, 1, 2])
+        self.assertEqual([entry.assigned_worker for entry in small_plan], [1, 1, 2, 2])
+
+    def test_run_partition_task_checksum_matches_per_row_reduction(self):
+        task = _PartitionTask(
+            partition_id="orders|stage=1|chunk=2",
+            table_name="orders",
+            start_row=6,
+            end_row=250,
+            partition_seed=4242,
+        )
+        rng = random.Random(task.partition_seed)
+        expected = 0
+        for offset in range(task.end_row - task.start_row + 1):
+            value = int(rng.random() * 1_000_000)
+            expected = (expected + value + offset + task.start_row) % 2_147_483_647
+
+        result = _run_partition_task(task)
+        self.assertEqual(result["checksum"], expected)
+        self.assertEqual(result["rows_processed"], 245)
+
+        failing = _PartitionTask(
+            partition_id="orders|stage=1|chunk=3",
+            table_name="orders",
+            start_row=251,
+            end_row=260,
+            partition_seed=1,
+            force_fail=True,
+        )
+        outcomes = _run_partition_batch((task, failing))
+        self.assertEqual(outcomes[0], (245, expected, result["memory_mb"]))
+        self.assertIsInstance(outcomes[1], RuntimeError)
 
     def test_run_generation_with_multiprocessing_single_process_mode(self):
         config = build_multiprocess_config(
@@ -126,6 +215,17 @@ class TestMultiprocessingRuntime(unittest.TestCase):
         self.assertGreater(result.total_rows, 0)
         self.assertTrue(result.strategy_result.rows_by_table)
 
+    def test_ledger_close_error_does_not_mask_run_error(self):
+        config = self._multi_config()
+        with mock.patch(
+            "src.runtime.core.mp_execution._run_generation_with_event_buffer",
+            side_effect=ValueError("run failed"),
+        ), mock.patch.object(_LedgerCommitCoordinator, "close", side_effect=ValueError("ledger failed")) as close:
+            with self.assertRaises(ValueError) as ctx:
+                run_generation_with_multiprocessing(self._project(), self._profile(), config)
+        self.assertEqual(str(ctx.exception), "run failed")
+        close.assert_called_once()
+
     def test_run_generation_with_multiprocessing_multi_mode_emits_events(self):
         config = self._multi_config()
         seen_kinds: list[str] = []
@@ -141,8 +241,105 @@ class TestMultiprocessingRuntime(unittest.TestCase):
         self.assertFalse(result.fallback_used)
         self.assertGreater(result.total_rows, 0)
 
+    def test_run_generation_with_multiprocessing_buffered_events_keep_order(self):
+        config = self._multi_config()
+        seen: list = []
+        run_generation_with_multiprocessing(
+            self._project(),
+            self._profile(),
+            config,
+            on_event=seen.append,
+        )
+        self.assertEqual(seen[0].kind, "started")
+        self.assertEqual(seen[-1].kind, "run_done")
+        progress_rows = [event.rows_processed for event in seen if event.kind == "progress"]
+        self.assertEqual(progress_rows, sorted(progress_rows))
+
+        def failing_callback(event) -> None:
+            if event.kind == "progress":
+                raise RuntimeError("callback failed")
+
+        with self.assertRaises(RuntimeError):
+            run_generation_with_multiprocessing(
+                self._project(),
+                self._profile(),
+                config,
+                on_event=failing_callback,
+            )
+
+    def test_claim_worker_slot_prefers_planned_worker_then_least_loaded(self):
+        self.assertEqual(_claim_worker_slot(2, {1: 1, 2: 0, 3: 0}), 2)
+        self.assertEqual(_claim_worker_slot(2, {1: 1, 2: 3, 3: 0}), 3)
+        self.assertEqual(_claim_worker_slot(1, {1: 2, 2: 1, 3: 1}), 2)
+
+    def test_adaptive_inflight_cap_tracks_completion_latency(self):
+        config = MultiprocessConfig(
+            mode="multi_process_local",
+            worker_count=2,
+            max_inflight_chunks=64,
+            ipc_queue_size=128,
+        )
+        self.assertEqual(_adaptive_inflight_cap(config, None), 64)
+        self.assertEqual(_adaptive_inflight_cap(config, 0.001), 50)
+        self.assertEqual(_adaptive_inflight_cap(config, 0.0001), 64)
+        self.assertEqual(_adaptive_inflight_cap(config, 5.0), 4)
+
+        result = run_generation_with_multiprocessing(self._project(), self._profile(), self._multi_config())
+        self.assertGreater(result.run_ledger["task_completion_ewma_seconds"], 0.0)
+
+    def test_event_buffer_drops_progress_when_full_and_keeps_terminal_events(self):
+        started = threading.Event()
+        release = threading.Event()
+        delivered: list[MultiprocessEvent] = []
+
+        def slow_callback(event: MultiprocessEvent) -> None:
+            started.set()
+            release.wait(timeout=5)
+            delivered.append(event)
+
+        buffer = _EventBuffer(slow_callback, capacity=2)
+        buffer.emit(MultiprocessEvent(kind="progress", rows_processed=1))
+        self.assertTrue(started.wait(timeout=5))
+        for rows in (2, 3, 4, 5):
+            buffer.emit(MultiprocessEvent(kind="progress", rows_processed=rows))
+        release.set()
+        buffer.emit_sync(MultiprocessEvent(kind="run_done", rows_processed=5))
+
+        self.assertEqual(buffer.dropped_events, 2)
+        self.assertEqual([event.rows_processed for event in delivered], [1, 2, 3, 5])
+        self.assertEqual(delivered[-1].kind, "run_done")
+
+    def test_progress_throttle_coalesces_fine_grained_progress(self):
+        throttle = _ProgressThrottle(200_000, min_interval_seconds=3600.0)
+        self.assertTrue(throttle.should_emit(10))
+        self.assertFalse(throttle.should_emit(1_500))
+        self.assertTrue(throttle.should_emit(2_010))
+        self.assertFalse(throttle.should_emit(3_000))
+        self.assertTrue(throttle.should_emit(200_000))
+
+    def test_run_generation_with_multiprocessing_batches_small_partitions(self):
+        config = build_multiprocess_config(
+            mode_value="multi_process_local",
+            worker_count_value="1",
+            max_inflight_chunks_value="8",
+            ipc_queue_size_value="64",
+            retry_limit_value="1",
+        )
+        profile = self._profile(chunk_size_rows="1")
+        plan = build_partition_plan(self._project(), profile, config)
+        self.assertEqual(_partition_batch_size(len(plan), config.worker_count), 6)
+
+        result = run_generation_with_multiprocessing(
+            self._project(),
+            profile,
+            config,
+            fail_partition_ids={plan[1].partition_id},
+        )
+        self.assertEqual({entry.status for entry in result.partition_plan}, {"done"})
+        self.assertEqual([failure.action for failure in result.failures], ["retry"])
+
     def test_run_generation_with_multiprocessing_can_fallback(self):
-        cpu_count = max(1, int(os.cpu_count() or 1))
+        cpu_count = available_cpu_count()
         workers = min(2, cpu_count)
         config = build_multiprocess_config(
             mode_value="multi_process_local",
@@ -177,6 +374,11 @@ class TestMultiprocessingRuntime(unittest.TestCase):
             loaded = load_run_ledger(str(saved_path))
             self.assertEqual(loaded["project_name"], "mp_demo")
             validate_run_ledger(self._project(), self._profile(), config, loaded)
+            self.assertNotIn("\n", saved_path.read_text(encoding="utf-8"))
+
+            pretty_path = save_run_ledger(str(Path(tmp) / "pretty.json"), ledger, pretty=True)
+            self.assertEqual(load_run_ledger(str(pretty_path)), loaded)
+            self.assertIn("\n  ", pretty_path.read_text(encoding="utf-8"))
 
             bad = dict(loaded)
             bad["project_name"] = "other_project"
@@ -186,6 +388,171 @@ class TestMultiprocessingRuntime(unittest.TestCase):
             self.assertIn("Execution Orchestrator / Run recovery", msg)
             self.assertIn("Fix:", msg)
 
+    def test_run_generation_with_multiprocessing_persists_ledger_path(self):
+        config = self._multi_config()
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested" / "run_ledger.json"
+            run_generation_with_multiprocessing(
+                self._project(),
+                self._profile(),
+                config,
+                run_ledger_path=f"  {path}  ",
+            )
+            loaded = load_run_ledger(str(path))
+        statuses = {part["status"] for part in loaded["partitions"].values()}
+        self.assertEqual(statuses, {"done"})
+
+    def test_persist_ledger_if_needed_ignores_blank_paths(self):
+        ledger = {"partitions": {}}
+        with mock.patch("src.runtime.core.mp_execution.save_run_ledger") as save:
+            _persist_ledger_if_needed(None, ledger)
+            _persist_ledger_if_needed("   ", ledger)
+        save.assert_not_called()
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "run_ledger.json"
+            _persist_ledger_if_needed(str(path), ledger)
+            self.assertEqual(load_run_ledger(str(path))["partitions"], {})
+
+    def test_ledger_persist_policy_never_skips_ledger_file(self):
+        config = build_multiprocess_config(
+            mode_value="multi_process_local",
+            worker_count_value="1",
+            max_inflight_chunks_value="2",
+            ipc_queue_size_value="64",
+            retry_limit_value="1",
+            ledger_persist_policy_value=" Never ",
+        )
+        self.assertEqual(config.ledger_persist_policy, "never")
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested" / "run_ledger.json"
+            result = run_generation_with_multiprocessing(
+                self._project(),
+                self._profile(),
+                config,
+                run_ledger_path=str(path),
+            )
+            self.assertFalse(path.parent.exists())
+        self.assertTrue(result.run_ledger["partitions"])
+
+        with self.assertRaises(ValueError) as ctx:
+            build_multiprocess_config(
+                mode_value="multi_process_local",
+                worker_count_value="1",
+                max_inflight_chunks_value="2",
+                ipc_queue_size_value="64",
+                retry_limit_value="1",
+                ledger_persist_policy_value="sometimes",
+            )
+        self.assertIn("Execution Orchestrator / Ledger persist policy", str(ctx.exception))
+
+    def test_ledger_commit_coordinator_groups_writes(self):
+        ledger = {"partitions": {}}
+        coordinator = _LedgerCommitCoordinator(max_batch=3, max_wait_seconds=3600.0)
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "run_ledger.json"
+            with mock.patch("src.runtime.core.mp_ledger._write_run_ledger") as write:
+                coordinator.start(path, ledger)
+                self.assertEqual(write.call_count, 1)
+                coordinator.mark_dirty()
+                coordinator.mark_dirty()
+                self.assertEqual(write.call_count, 1)
+                coordinator.mark_dirty()
+                self.assertEqual(write.call_count, 2)
+                coordinator.mark_dirty()
+                coordinator.flush()
+                coordinator.flush()
+                self.assertEqual(write.call_count, 3)
+
+    def test_ledger_commit_coordinator_background_writes_land_on_close(self):
+        ledger = {"partitions": {"p1": {"status": "pending"}}}
+        coordinator = _LedgerCommitCoordinator(max_batch=1, background=True)
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "run_ledger.json"
+            coordinator.start(path, ledger)
+            ledger["partitions"]["p1"]["status"] = "done"
+            coordinator.mark_dirty("p1")
+            coordinator.close()
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8")), ledger)
+
+            blocked = Path(tmp) / "missing" / "run_ledger.json"
+            failing = _LedgerCommitCoordinator(background=True)
+            failing.start(blocked, ledger)
+            with self.assertRaises(ValueError) as ctx:
+                failing.close()
+            self.assertIn("Execution Orchestrator / Run ledger", str(ctx.exception))
+
+    def test_ledger_background_flush_wait_lands_and_surfaces_any_writer_error(self):
+        ledger = {"partitions": {"p1": {"status": "pending", "retry_count": 0, "error_message": ""}}}
+        coordinator = _LedgerCommitCoordinator(max_wait_seconds=3600.0, background=True, journal=True)
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "run_ledger.json"
+            coordinator.start(path, ledger)
+            ledger["partitions"]["p1"]["status"] = "failed"
+            coordinator.mark_dirty("p1")
+            coordinator.flush(wait=True)
+            journal_lines = (Path(tmp) / "run_ledger.json.journal").read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(journal_lines), 1)
+            self.assertIn('"status":"failed"', journal_lines[0])
+            coordinator.close()
+
+            failing = _LedgerCommitCoordinator(background=True)
+            with mock.patch(
+                "src.runtime.core.mp_ledger._apply_ledger_writes",
+                side_effect=RuntimeError("disk vanished"),
+            ):
+                failing.start(path, ledger)
+                with self.assertRaises(RuntimeError):
+                    failing.flush(wait=True)
+
+    def test_ledger_journal_appends_replays_and_compacts(self):
+        ledger = {
+            "partitions": {
+                "p1": {"status": "pending", "retry_count": 0, "error_message": ""},
+                "p2": {"status": "pending", "retry_count": 0, "error_message": ""},
+            }
+        }
+        coordinator = _LedgerCommitCoordinator(max_batch=1, max_wait_seconds=3600.0, journal=True)
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "run_ledger.json"
+            journal_path = Path(tmp) / "run_ledger.json.journal"
+            coordinator.start(path, ledger)
+            snapshot = path.read_bytes()
+            ledger["partitions"]["p1"]["status"] = "done"
+            coordinator.mark_dirty("p1")
+            ledger["partitions"]["p2"].update(status="failed", retry_count=1, error_message="boom")
+            coordinator.mark_dirty("p2")
+            self.assertEqual(path.read_bytes(), snapshot)
+            self.assertEqual(len(journal_path.read_text(encoding="utf-8").splitlines()), 2)
+
+            with journal_path.open("ab") as handle:
+                payload = b'{"partition_id":"p1","status":"pending","retry_count":0,"error_message":""}'
+                handle.write(b"%08x %s\n" % (zlib.crc32(payload) ^ 1, payload))
+                handle.write(b'0000abcd {"partition_id":"p1","sta')
+            loaded = load_run_ledger(str(path))
+            self.assertEqual(loaded["partitions"], ledger["partitions"])
+
+            coordinator.close()
+            self.assertFalse(journal_path.exists())
+            self.assertEqual(load_run_ledger(str(path))["partitions"], ledger["partitions"])
+
+    def test_ledger_journal_append_uses_vectored_writes(self):
+        frames = [b"%04d\n" % index for index in range(1500)]
+        real_writev = os.writev if hasattr(os, "writev") else None
+        calls = []
+
+        def short_writev(fd, buffers):
+            calls.append(len(buffers))
+            if real_writev is None:
+                return 0
+            return real_writev(fd, buffers[:-1])
+
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "run_ledger.json.journal"
+            with mock.patch("src.runtime.core.mp_ledger.os.writev", short_writev, create=True):
+                _append_ledger_journal(path, frames)
+            self.assertEqual(calls, [1024, 476])
+            self.assertEqual(path.read_bytes(), b"".join(frames))
+
     def test_run_generation_with_multiprocessing_cancel_is_actionable(self):
         config = build_multiprocess_config(
             mode_value="single_process",
@@ -2,9 +2,16 @@ import unittest
 from datetime import date
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest import mock
 
 from src.performance_scaling import (
+    FK_CACHE_MODES,
+    OUTPUT_MODES,
     PerformanceRunCancelled,
+    RuntimeEvent,
+    _selected_tables_with_required_parents,
+    _topological_table_order,
+    _write_rows_to_csv_folder,
     build_chunk_plan,
     build_performance_profile,
     estimate_workload,
@@ -14,6 +21,8 @@ from src.performance_scaling import (
     summarize_estimates,
     validate_performance_profile,
 )
+from src.generator_project import generate_project_rows
+from src.runtime.core import perf_planning
 from src.schema_project_model import ColumnSpec, ForeignKeySpec, SchemaProject, TableSpec
 
 
@@ -140,6 +149,19 @@ class TestPerformanceScaling(unittest.TestCase):
         self.assertEqual(profile.chunk_size_rows, 1000)
         self.assertEqual(profile.preview_page_size, 500)
 
+    def test_build_performance_profile_normalizes_mode_and_flag_text(self):
+        profile = build_performance_profile(
+            **{
+                **self._profile_kwargs(),
+                "output_mode_value": "  CSV ",
+                "fk_cache_mode_value": "Memory",
+                "strict_deterministic_chunking_value": " Yes ",
+            }
+        )
+        self.assertIs(profile.output_mode, OUTPUT_MODES[1])
+        self.assertIs(profile.fk_cache_mode, FK_CACHE_MODES[1])
+        self.assertTrue(profile.strict_deterministic_chunking)
+
     def test_build_profile_errors_are_actionable(self):
         with self.assertRaises(ValueError) as mode_ctx:
             build_performance_profile(
@@ -235,6 +257,7 @@ class TestPerformanceScaling(unittest.TestCase):
         second = build_chunk_plan(self._project(), profile)
         self.assertEqual(first, second)
         self.assertTrue(first)
+        self.assertFalse(hasattr(first[0], "__dict__"))
 
         stage_by_table = {entry.table_name: entry.stage for entry in first}
         self.assertEqual(stage_by_table["customers"], 0)
@@ -256,6 +279,42 @@ class TestPerformanceScaling(unittest.TestCase):
         self.assertEqual(summary.total_rows, 50)
         self.assertEqual(summary.max_stage, 1)
 
+    def test_build_chunk_plan_reuses_cached_plan_for_identical_inputs(self):
+        profile = build_performance_profile(**{**self._profile_kwargs(), "chunk_size_rows_value": "8"})
+        first = build_chunk_plan(self._project(), profile)
+        first.clear()
+        with mock.patch("src.runtime.core.perf_planning.validate_performance_profile") as validate:
+            second = build_chunk_plan(self._project(), profile)
+        validate.assert_not_called()
+        self.assertEqual(len(second), 7)
+
+        larger = build_performance_profile(
+            **{**self._profile_kwargs(), "chunk_size_rows_value": "8", "row_overrides_json_value": "{\"orders\": 48}"}
+        )
+        self.assertEqual(len(build_chunk_plan(self._project(), larger)), 8)
+        self.assertEqual(estimate_workload(self._project(), larger)[1].estimated_rows, 48)
+
+    def test_build_chunk_plan_builds_cache_key_once_on_miss(self):
+        profile = build_performance_profile(**{**self._profile_kwargs(), "chunk_size_rows_value": "9"})
+        with mock.patch.dict(perf_planning._CHUNK_PLAN_CACHE, clear=True), mock.patch(
+            "src.runtime.core.perf_planning._plan_cache_key",
+            wraps=perf_planning._plan_cache_key,
+        ) as cache_key:
+            entries = build_chunk_plan(self._project(), profile)
+        self.assertEqual(cache_key.call_count, 1)
+        self.assertEqual(sum(entry.rows_in_chunk for entry in entries), 50)
+
+    def test_run_performance_benchmark_validates_profile_once(self):
+        profile = build_performance_profile(**{**self._profile_kwargs(), "chunk_size_rows_value": "7"})
+        with mock.patch(
+            "src.runtime.core.perf_execution.validate_performance_profile",
+            wraps=validate_performance_profile,
+        ) as outer, mock.patch("src.runtime.core.perf_planning.validate_performance_profile") as inner:
+            result = run_performance_benchmark(self._project(), profile)
+        self.assertEqual(outer.call_count, 1)
+        inner.assert_not_called()
+        self.assertEqual(result.chunk_summary.total_rows, 50)
+
     def test_build_chunk_plan_rejects_cyclic_dependencies(self):
         cycle_project = SchemaProject(
             name="cycle",
@@ -297,20 +356,100 @@ class TestPerformanceScaling(unittest.TestCase):
         self.assertIn("cyclic table dependencies", msg)
         self.assertIn("Fix:", msg)
 
+    def test_topological_table_order_prefers_smallest_ready_table(self):
+        def table(name: str) -> TableSpec:
+            return TableSpec(
+                table_name=name,
+                row_count=1,
+                columns=[
+                    ColumnSpec(f"{name}_id", "int", nullable=False, primary_key=True),
+                    ColumnSpec("parent_id", "int", nullable=False),
+                ],
+            )
+
+        names = ("z_root", "a_root", "m_child", "b_child", "c_grandchild")
+        project = SchemaProject(
+            name="topo",
+            seed=1,
+            tables=[table(name) for name in names],
+            foreign_keys=[
+                ForeignKeySpec("m_child", "parent_id", "z_root", "z_root_id", 1, 1),
+                ForeignKeySpec("b_child", "parent_id", "z_root", "z_root_id", 1, 1),
+                ForeignKeySpec("c_grandchild", "parent_id", "a_root", "a_root_id", 1, 1),
+                ForeignKeySpec("c_grandchild", "parent_id", "b_child", "b_child_id", 1, 1),
+            ],
+        )
+        ordered, parents = _topological_table_order(project, names)
+        self.assertEqual(ordered, ("a_root", "z_root", "b_child", "c_grandchild", "m_child"))
+        self.assertEqual(parents["c_grandchild"], {"a_root", "b_child"})
+
+        parents["c_grandchild"].add("mutated")
+        cached_ordered, cached_parents = _topological_table_order(project, names)
+        self.assertEqual(cached_ordered, ordered)
+        self.assertEqual(cached_parents["c_grandchild"], {"a_root", "b_child"})
+
+        project.foreign_keys.append(ForeignKeySpec("a_root", "parent_id", "m_child", "m_child_id", 1, 1))
+        reordered, _parents = _topological_table_order(project, names)
+        self.assertEqual(reordered, ("z_root", "b_child", "m_child", "a_root", "c_grandchild"))
+
+    def test_selected_tables_with_required_parents_pulls_in_fk_ancestors(self):
+        def table(name: str) -> TableSpec:
+            return TableSpec(
+                table_name=name,
+                row_count=1,
+                columns=[
+                    ColumnSpec(f"{name}_id", "int", nullable=False, primary_key=True),
+                    ColumnSpec("parent_id", "int", nullable=False),
+                ],
+            )
+
+        names = ("t4", "t3", "t2", "t1", "side")
+        project = SchemaProject(
+            name="chain",
+            seed=1,
+            tables=[table(name) for name in names],
+            foreign_keys=[
+                ForeignKeySpec("t2", "parent_id", "t1", "t1_id", 1, 1),
+                ForeignKeySpec("t3", "parent_id", "t2", "t2_id", 1, 1),
+                ForeignKeySpec("t4", "parent_id", "t3", "t3_id", 1, 1),
+                ForeignKeySpec("side", "parent_id", "t1", "t1_id", 1, 1),
+            ],
+        )
+        profile = build_performance_profile(
+            **{**self._profile_kwargs(), "target_tables_value": "t4", "row_overrides_json_value": ""}
+        )
+        self.assertEqual(_selected_tables_with_required_parents(project, profile), ("t1", "t2", "t3", "t4"))
+
     def test_run_performance_benchmark_emits_events(self):
         profile = build_performance_profile(**self._profile_kwargs())
-        seen_kinds: list[str] = []
+        events: list[RuntimeEvent] = []
 
         result = run_performance_benchmark(
             self._project(),
             profile,
-            on_event=lambda event: seen_kinds.append(event.kind),
+            on_event=events.append,
         )
+        seen_kinds = [event.kind for event in events]
         self.assertTrue(result.chunk_plan)
         self.assertIn("started", seen_kinds)
         self.assertIn("progress", seen_kinds)
         self.assertEqual(seen_kinds[-1], "run_done")
 
+        first_entry = result.chunk_plan[0]
+        self.assertEqual(
+            events[1],
+            RuntimeEvent(
+                kind="progress",
+                table_name=first_entry.table_name,
+                stage=first_entry.stage,
+                chunk_index=first_entry.chunk_index,
+                total_chunks=len(result.chunk_plan),
+                rows_processed=first_entry.rows_in_chunk,
+                total_rows=sum(entry.rows_in_chunk for entry in result.chunk_plan),
+                message="Benchmark progress.",
+            ),
+        )
+
     def test_run_performance_benchmark_cancellation_is_actionable(self):
         profile = build_performance_profile(**self._profile_kwargs())
 
@@ -324,6 +463,20 @@ class TestPerformanceScaling(unittest.TestCase):
         self.assertIn("Performance Workbench / Cancel", msg)
         self.assertIn("Fix:", msg)
 
+    def test_run_performance_benchmark_polls_cancel_every_interval(self):
+        profile = build_performance_profile(
+            **{**self._profile_kwargs(), "chunk_size_rows_value": "1", "row_overrides_json_value": "{\"orders\": 200}"}
+        )
+        polls = []
+
+        def cancel_requested() -> bool:
+            polls.append(1)
+            return False
+
+        result = run_performance_benchmark(self._project(), profile, cancel_requested=cancel_requested)
+        self.assertEqual(result.chunk_summary.total_chunks, 210)
+        self.assertEqual(len(polls), 1 + 4)
+
     def test_run_generation_with_strategy_preview_mode(self):
         profile = build_performance_profile(
             **{
@@ -331,13 +484,71 @@ class TestPerformanceScaling(unittest.TestCase):
                 "output_mode_value": "preview",
             }
         )
-        result = run_generation_with_strategy(self._project(), profile)
+        with mock.patch("src.runtime.core.perf_execution._progress_event") as progress_event:
+            result = run_generation_with_strategy(self._project(), profile)
+        progress_event.assert_not_called()
         self.assertEqual(result.csv_paths, {})
         self.assertEqual(result.sqlite_counts, {})
         self.assertGreater(result.total_rows, 0)
         self.assertIn("customers", result.rows_by_table)
         self.assertIn("orders", result.rows_by_table)
 
+    def test_run_generation_with_strategy_preview_keeps_only_selected_tables(self):
+        profile = build_performance_profile(
+            **{
+                **self._profile_kwargs(),
+                "target_tables_value": "customers",
+                "row_overrides_json_value": "",
+                "output_mode_value": "preview",
+            }
+        )
+        result = run_generation_with_strategy(self._project(), profile)
+        self.assertEqual(list(result.rows_by_table), ["customers"])
+        self.assertEqual(result.rows_by_table["customers"], generate_project_rows(self._project())["customers"])
+        self.assertEqual(result.total_rows, 10)
+
+    def test_write_rows_to_csv_folder_encodes_bytes_and_reports_progress(self):
+        rows_by_table = {
+            "blobs": [{"blob_id": idx, "payload": bytes([idx]), "label": f"b{idx}"} for idx in range(1, 6)],
+            "tags": [{"tag": "a,b"}, {"tag": "c"}],
+        }
+        events = []
+        with TemporaryDirectory() as tmp:
+            paths = _write_rows_to_csv_folder(
+                rows_by_table,
+                ("blobs", "tags"),
+                tmp,
+                buffer_rows=2,
+                on_event=events.append,
+            )
+            self.assertEqual(list(paths), ["blobs", "tags"])
+            blob_lines = Path(paths["blobs"]).read_text(encoding="utf-8").splitlines()
+            tag_lines = Path(paths["tags"]).read_text(encoding="utf-8").splitlines()
+        self.assertEqual(blob_lines[0], "blob_id,payload,label")
+        self.assertEqual(blob_lines[1], "1,AQ==,b1")
+        self.assertEqual(len(blob_lines), 6)
+        self.assertEqual(tag_lines, ["tag", '"a,b"', "c"])
+
+        blobs = {"blobs": [{"blob_id": 1, "payload": b"\x01"}, {"blob_id": 2, "payload": None}, {"blob_id": 3, "payload": b"\x03"}]}
+        with TemporaryDirectory() as tmp:
+            paths = _write_rows_to_csv_folder(blobs, ("blobs",), tmp, buffer_rows=2)
+            self.assertEqual(
+                Path(paths["blobs"]).read_text(encoding="utf-8").splitlines(),
+                ["blob_id,payload", "1,AQ==", "2,", "3,Aw=="],
+            )
+
+        ragged = {"people": [{"id": 1, "name": "x"}, {"id": 2, "name": "y"}, {"id": 3}]}
+        with TemporaryDirectory() as tmp:
+            paths = _write_rows_to_csv_folder(ragged, ("people",), tmp, buffer_rows=10)
+            self.assertEqual(
+                Path(paths["people"]).read_text(encoding="utf-8").splitlines(),
+                ["id,name", "1,x", "2,y", "3,"],
+            )
+        self.assertEqual(
+            [(event.table_name, event.rows_processed) for event in events],
+            [("blobs", 2), ("blobs", 4), ("tags", 2)],
+        )
+
     def test_run_generation_with_strategy_csv_mode_writes_files(self):
         profile = build_performance_profile(
             **{
@@ -3,8 +3,10 @@ import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from src.schema_project_io import load_project_from_json
+from src.project_paths import repo_root, to_repo_relative_path
+from src.schema_project_io import _normalize_sample_csv_paths, load_project_from_json
 
 
 class TestLoadProjectPlaceholder(unittest.TestCase):
@@ -76,6 +78,63 @@ class TestLoadProjectPlaceholder(unittest.TestCase):
             except PermissionError:
                 pass
 
+    def test_moved_checkout_path_is_rebuilt_from_tests_anchor(self):
+        moved = Path("/old_checkout/Generic-Data-Application/tests/fixtures/city_country_pool.csv")
+        self.assertEqual(to_repo_relative_path(str(moved)), "tests/fixtures/city_country_pool.csv")
+
+        outside = Path("/old_checkout/data/city_country_pool.csv")
+        self.assertEqual(to_repo_relative_path(str(outside)), str(outside))
+        self.assertIs(repo_root(), repo_root())
+        self.assertEqual(to_repo_relative_path(" ./tests/fixtures/city_country_pool.csv "), "tests/fixtures/city_country_pool.csv")
+
+    def test_normalize_maps_placeholders_and_trims_only_padded_paths(self):
+        data = {
+            "tables": [
+                {
+                    "columns": [
+                        {"generator": "sample_csv", "params": {"path": "  __CITY_COUNTRY_CSV__ "}},
+                        {"generator": "sample_csv", "params": {"path": "tests/fixtures/city_country_pool.csv"}},
+                        {"generator": "sample_csv", "params": {"path": "   "}},
+                        {"generator": "choice", "params": {"path": "__CITY_COUNTRY_CSV__"}},
+                    ]
+                }
+            ],
+            "sample_profile_fits": [{"sample_source": {"path": "__CITY_COUNTRY_CSV__"}}],
+        }
+        _normalize_sample_csv_paths(data)
+
+        columns = data["tables"][0]["columns"]
+        self.assertEqual(columns[0]["params"]["path"], "tests/fixtures/city_country_pool.csv")
+        self.assertEqual(columns[1]["params"]["path"], "tests/fixtures/city_country_pool.csv")
+        self.assertEqual(columns[2]["params"]["path"], "   ")
+        self.assertEqual(columns[3]["params"]["path"], "__CITY_COUNTRY_CSV__")
+        self.assertEqual(
+            data["sample_profile_fits"][0]["sample_source"]["path"],
+            "tests/fixtures/city_country_pool.csv",
+        )
+
+    def test_normalize_resolves_each_distinct_sample_path_once(self):
+        shared = str(Path("/old_checkout/app/tests/fixtures/city_country_pool.csv"))
+        data = {
+            "tables": [
+                {"columns": [{"generator": "sample_csv", "params": {"path": shared}} for _ in range(5)]},
+            ],
+            "sample_profile_fits": [{"sample_source": {"path": shared}}],
+        }
+        with mock.patch(
+            "src.schema_project_io.to_repo_relative_path",
+            wraps=to_repo_relative_path,
+        ) as relative:
+            _normalize_sample_csv_paths(data)
+
+        self.assertEqual(relative.call_count, 1)
+        for column in data["tables"][0]["columns"]:
+            self.assertEqual(column["params"]["path"], "tests/fixtures/city_country_pool.csv")
+        self.assertEqual(
+            data["sample_profile_fits"][0]["sample_source"]["path"],
+            "tests/fixtures/city_country_pool.csv",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
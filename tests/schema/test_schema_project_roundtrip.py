@@ -2,12 +2,19 @@ import unittest
 import tempfile
 import os
 import json
+import pickle
 from pathlib import Path
+from unittest import mock
 
 from src.schema_project_model import (
-    SchemaProject, TableSpec, ColumnSpec, ForeignKeySpec
+    SchemaProject, TableSpec, ColumnSpec, ForeignKeySpec, validate_project
+)
+from src.schema_project_io import (
+    _quote_identifier,
+    build_project_sql_ddl,
+    load_project_from_json,
+    save_project_to_json,
 )
-from src.schema_project_io import save_project_to_json, load_project_from_json, build_project_sql_ddl
 
 
 class TestSchemaProjectRoundtrip(unittest.TestCase):
@@ -56,6 +63,7 @@ class TestSchemaProjectRoundtrip(unittest.TestCase):
             save_project_to_json(project, path)
             loaded = load_project_from_json(path)
             self.assertEqual(project, loaded)
+            self.assertIs(loaded.tables[0].columns[0].dtype, loaded.tables[1].columns[0].dtype)
         finally:
             try:
                 os.remove(path)
@@ -70,10 +78,14 @@ class TestSchemaProjectRoundtrip(unittest.TestCase):
         tmp.close()
 
         try:
-            save_project_to_json(project, path)
+            with mock.patch("src.schema_project_io.validate_project", wraps=validate_project) as validate:
+                save_project_to_json(project, path)
+            validate.assert_called_once_with(project)
             with open(path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
+                text = f.read()
+            raw = json.loads(text)
 
+            self.assertEqual(text, json.dumps(raw, indent=2))
             self.assertIn("sql_ddl", raw)
             self.assertIsInstance(raw["sql_ddl"], str)
             self.assertEqual(raw["sql_ddl"], build_project_sql_ddl(project))
@@ -89,6 +101,57 @@ class TestSchemaProjectRoundtrip(unittest.TestCase):
             except PermissionError:
                 pass
 
+    def test_model_specs_use_slots_and_pickle(self):
+        project = self._project()
+        for spec in (project, project.tables[0], project.tables[0].columns[0], project.foreign_keys[0]):
+            self.assertFalse(hasattr(spec, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(project)), project)
+
+    def test_column_spec_rejects_non_object_params_at_construction(self):
+        with self.assertRaises(ValueError) as ctx:
+            ColumnSpec("code", "text", generator="choice_weighted", params=["A", "B"])
+        self.assertEqual(
+            str(ctx.exception),
+            "Column 'code': generator params must be a JSON object. "
+            "Fix: set params to an object (for example {\"path\": \"...\"}) or null.",
+        )
+        with self.assertRaises(ValueError):
+            ColumnSpec("blob", "bytes", params=[8])
+        self.assertIsNone(ColumnSpec("code", "text").params)
+        # Columns that never read params keep accepting them as before.
+        self.assertEqual(ColumnSpec("code", "text", params=[1]).params, [1])
+        self.assertEqual(ColumnSpec("blob", "bytes", params=[]).params, [])
+
+    def test_load_reports_table_and_column_for_non_object_params(self):
+        payload = {
+            "name": "bad_params",
+            "seed": 1,
+            "tables": [
+                {
+                    "table_name": "t",
+                    "row_count": 1,
+                    "columns": [
+                        {"name": "id", "dtype": "int", "primary_key": True, "nullable": False},
+                        {"name": "code", "dtype": "text", "generator": "choice_weighted", "params": [1]},
+                    ],
+                }
+            ],
+            "foreign_keys": [],
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bad_params.json")
+            with open(path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            with self.assertRaises(ValueError) as ctx:
+                load_project_from_json(path)
+        self.assertIn("Table 't', column 'code': generator params must be a JSON object", str(ctx.exception))
+        self.assertIn("Fix:", str(ctx.exception))
+
+    def test_quote_identifier_escapes_embedded_quotes(self):
+        self.assertEqual(_quote_identifier("customers"), '"customers"')
+        self.assertEqual(_quote_identifier('odd"name'), '"odd""name"')
+        self.assertEqual(_quote_identifier('odd"name'), '"odd""name"')
+
     def test_load_rejects_non_string_sql_ddl_with_fix_hint(self):
         payload = {
             "name": "demo",
@@ -126,6 +189,31 @@ class TestSchemaProjectRoundtrip(unittest.TestCase):
             except PermissionError:
                 pass
 
+    def test_load_rejects_malformed_document_shape_with_fix_hint(self):
+        cases = [
+            ([], "Schema project JSON must be an object."),
+            ({"name": "demo"}, "Project: tables must be a list."),
+            ({"name": "demo", "tables": ["customers"]}, "Project, tables[0]: table must be an object."),
+            (
+                {"name": "demo", "tables": [{"table_name": "customers", "columns": {"id": "int"}}]},
+                "Table 'customers': columns must be a list of objects.",
+            ),
+            (
+                {"name": "demo", "tables": [], "foreign_keys": [["orders", "customers"]]},
+                "Project: foreign_keys must be a list of objects when provided.",
+            ),
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "malformed.json")
+            for payload, expected in cases:
+                with self.subTest(expected=expected):
+                    with open(path, "w", encoding="utf-8") as f:
+                        json.dump(payload, f)
+                    with self.assertRaises(ValueError) as ctx:
+                        load_project_from_json(path)
+                    self.assertIn(expected, str(ctx.exception))
+                    self.assertIn("Fix:", str(ctx.exception))
+
     def test_save_normalizes_sample_csv_path_to_repo_relative(self):
         fixture_csv = Path(__file__).resolve().parents[1] / "fixtures" / "city_country_pool.csv"
         project = SchemaProject(
@@ -161,6 +249,7 @@ class TestSchemaProjectRoundtrip(unittest.TestCase):
 
             saved_path = raw["tables"][0]["columns"][1]["params"]["path"]
             self.assertEqual(saved_path, "tests/fixtures/city_country_pool.csv")
+            self.assertEqual(project.tables[0].columns[1].params["path"], str(fixture_csv))
         finally:
             try:
                 os.remove(path)
@@ -60,6 +60,40 @@ class TestSchemaProjectSQLiteFK(unittest.TestCase):
             except PermissionError:
                 pass
 
+    def test_bulk_insert_batches_rows_in_wal_mode(self):
+        project = SchemaProject(
+            name="sqlite-bulk",
+            seed=1,
+            tables=[
+                TableSpec(
+                    table_name="customers",
+                    row_count=7,
+                    columns=[
+                        ColumnSpec("customer_id", "int", nullable=False, primary_key=True),
+                        ColumnSpec("name", "text", nullable=True),
+                    ],
+                ),
+            ],
+        )
+        rows = {"customers": [{"customer_id": idx} for idx in range(1, 8)]}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "bulk.db")
+            create_tables(db_path, project)
+            counts = insert_project_rows(db_path, project, rows, chunk_size=3)
+            self.assertEqual(counts, {"customers": 7})
+            # The bulk insert's WAL mode is not left behind on the output database.
+            self.assertFalse(os.path.exists(db_path + "-wal"))
+            self.assertFalse(os.path.exists(db_path + "-shm"))
+
+            conn = sqlite3.connect(db_path)
+            try:
+                self.assertEqual(conn.execute("PRAGMA journal_mode;").fetchone()[0], "delete")
+                stored = conn.execute("SELECT customer_id, name FROM customers ORDER BY customer_id").fetchall()
+            finally:
+                conn.close()
+            self.assertEqual(stored, [(idx, None) for idx in range(1, 8)])
+
 
 if __name__ == "__main__":
     unittest.main()
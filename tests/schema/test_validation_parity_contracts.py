@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import ast
+import inspect
 import unittest
 
 from src.schema_project_model import ColumnSpec
@@ -7,6 +9,8 @@ from src.schema_project_model import ForeignKeySpec
 from src.schema_project_model import SchemaProject
 from src.schema_project_model import TableSpec
 from src.schema_project_model import validate_project
+from src.schema.validators import generator_rules_dependency
+from src.schema.validators import generator_rules_numeric
 
 
 class ValidationParityContractTests(unittest.TestCase):
@@ -216,6 +220,69 @@ class ValidationParityContractTests(unittest.TestCase):
             "Table 't', column 'city': generator 'sample_csv' requires params.path. Fix: set params.path to a CSV file path.",
         )
 
+    def test_empty_name_reported_before_earlier_duplicate(self) -> None:
+        id_column = ColumnSpec("id", "int", primary_key=True, nullable=False)
+        duplicate_tables = SchemaProject(
+            name="p",
+            tables=[TableSpec("t", [id_column]), TableSpec(" t ", [id_column]), TableSpec(" ", [id_column])],
+        )
+        self.assert_validation_error(
+            duplicate_tables,
+            "Project tables: table_name cannot be empty. Fix: set a non-empty table_name for every table.",
+        )
+
+        duplicate_tables.tables.pop()
+        self.assert_validation_error(
+            duplicate_tables,
+            "Project tables: table names must be unique (duplicate 't'). "
+            "Fix: rename duplicate tables so each table_name is unique.",
+        )
+
+        duplicate_columns = SchemaProject(
+            name="p",
+            tables=[TableSpec("t", [id_column, ColumnSpec("id ", "int"), ColumnSpec("", "text")])],
+        )
+        self.assert_validation_error(
+            duplicate_columns,
+            "Table 't': all column names must be non-empty. Fix: set a non-empty name for every column.",
+        )
+
+        duplicate_columns.tables[0].columns.pop()
+        self.assert_validation_error(
+            duplicate_columns,
+            "Table 't': column names must be unique (duplicate 'id'). Fix: rename duplicate columns so each column name is unique.",
+        )
+
+    def test_scd_fields_without_mode_still_rejected(self) -> None:
+        columns = [ColumnSpec("id", "int", primary_key=True, nullable=False), ColumnSpec("valid_from", "date")]
+        validate_project(SchemaProject(name="p", tables=[TableSpec("t", columns)]))
+        self.assert_validation_error(
+            SchemaProject(name="p", tables=[TableSpec("t", columns, scd_active_from_column="valid_from")]),
+            "Table 't': SCD fields provided without scd_mode. "
+            "Fix: set scd_mode='scd1' or scd_mode='scd2', or remove SCD fields.",
+        )
+
+    def test_generator_rule_dispatch_sets_match_validator_branches(self) -> None:
+        def branch_generators(module, function_name: str) -> set[str]:
+            tree = ast.parse(inspect.getsource(module))
+            function = next(
+                node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name == function_name
+            )
+            return {
+                node.test.comparators[0].value
+                for node in function.body
+                if isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+            }
+
+        self.assertEqual(
+            branch_generators(generator_rules_numeric, "validate_numeric_generator_rules"),
+            set(generator_rules_numeric.NUMERIC_RULE_GENERATORS),
+        )
+        self.assertEqual(
+            branch_generators(generator_rules_dependency, "validate_dependency_generator_rules"),
+            set(generator_rules_dependency.DEPENDENCY_RULE_GENERATORS),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()